@@ -30,6 +30,7 @@ import bisect
 import logging
 import math
 import random
+from operator import attrgetter, itemgetter
 from datetime import date, datetime, timedelta
 from typing import Callable, Optional
 
@@ -771,7 +772,7 @@ def _simulate(candidates: list[dict], spec: BacktestSpec) -> RunResult:
     max_concurrent = spec.sizing.max_concurrent
 
     # Order by entry; tie-break by exit so closes are deterministic.
-    candidates = sorted(candidates, key=lambda c: (c["entered_at"], c["exited_at"]))
+    candidates = sorted(candidates, key=itemgetter("entered_at", "exited_at"))
 
     realized_equity = capital
     open_positions: list[dict] = []  # each: {exit_at, net_pnl} — concurrency + sizing
@@ -787,7 +788,7 @@ def _simulate(candidates: list[dict], spec: BacktestSpec) -> RunResult:
         # its drawdown are built separately from a mark-to-market walk after
         # sizing (see _mtm_equity_curve), so open-position losses aren't lost.
         nonlocal realized_equity
-        open_positions.sort(key=lambda p: p["exit_at"])
+        open_positions.sort(key=itemgetter("exit_at"))
         while open_positions and open_positions[0]["exit_at"] <= when:
             realized_equity += open_positions.pop(0)["net_pnl"]
 
@@ -930,7 +931,7 @@ def _mtm_equity_curve(sized: list[dict], capital: float) -> list[EquityPoint]:
             "mval": [m[1] for m in s["marks"]],
             "cursor": 0,
         }
-        for s in sorted(sized, key=lambda s: s["entered_at"])
+        for s in sorted(sized, key=itemgetter("entered_at"))
     ]
     timeline = sorted({t for p in positions for t in p["mts"]})
     ptr = 0
@@ -1052,7 +1053,7 @@ def _daily_realized_equity(
 def _streaks(trades: list[TradeResult]) -> tuple:
     """(max_consecutive_wins, max_consecutive_losses), chronological."""
     max_w = max_l = cur_w = cur_l = 0
-    for t in sorted(trades, key=lambda x: (x.entered_at, x.seq)):
+    for t in sorted(trades, key=attrgetter("entered_at", "seq")):
         if t.net_pnl > 0:
             cur_w, cur_l = cur_w + 1, 0
         elif t.net_pnl < 0:
@@ -1063,6 +1064,19 @@ def _streaks(trades: list[TradeResult]) -> tuple:
     return max_w, max_l
 
 
+def _weekdays_between(lo: date, hi: date) -> int:
+    """Mon-Fri days in the inclusive range ``[lo, hi]``, in O(1).
+
+    Whole weeks contribute 5 each; only the <7-day remainder is walked, so a
+    multi-year window costs the same as a single week.
+    """
+    if hi < lo:
+        return 0
+    full_weeks, rem = divmod((hi - lo).days + 1, 7)
+    start = lo.weekday()
+    return full_weeks * 5 + sum(1 for i in range(rem) if (start + i) % 7 < 5)
+
+
 def _exposure_pct(
     trades: list[TradeResult], start_date: Optional[date], end_date: Optional[date]
 ) -> Optional[float]:
@@ -1089,13 +1103,7 @@ def _exposure_pct(
     merged_min += (ce - cs).total_seconds() / 60.0
     lo = start_date or ivals[0][0].date()
     hi = end_date or ivals[-1][1].date()
-    weekdays = 0
-    cur, one = lo, timedelta(days=1)
-    while cur <= hi:
-        if cur.weekday() < 5:
-            weekdays += 1
-        cur += one
-    denom = max(weekdays, 1) * _RTH_MINUTES_PER_DAY
+    denom = max(_weekdays_between(lo, hi), 1) * _RTH_MINUTES_PER_DAY
     return round(min(merged_min / denom * 100.0, 100.0), 1)
 
 
@@ -1410,7 +1418,7 @@ def _apply_cooldown(cards: list, cooldown_minutes: int) -> list:
     gap = timedelta(minutes=cooldown_minutes)
     last_kept: dict[str, datetime] = {}
     kept: list = []
-    for card in sorted(cards, key=lambda c: c.timestamp):
+    for card in sorted(cards, key=attrgetter("timestamp")):
         prev = last_kept.get(card.pattern)
         if prev is None or (card.timestamp - prev) >= gap:
             kept.append(card)
@@ -31,6 +31,7 @@ import json
 from bisect import bisect_left
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from types import SimpleNamespace
 from typing import Any, Optional
 
@@ -117,7 +118,7 @@ def count_with_forward(rows: list[BiasRow], horizons_min: list[int]) -> int:
     """
     if not rows:
         return 0
-    ordered = sorted(rows, key=lambda r: r.timestamp)
+    ordered = sorted(rows, key=attrgetter("timestamp"))
     fwd = _forward_returns(ordered, horizons_min)
     return sum(
         1
@@ -150,7 +151,7 @@ def evaluate_sweep(
     Pure / DB-free so it is unit-testable: pass reconstructed rows in, get the
     stats table out.
     """
-    rows = sorted(rows, key=lambda r: r.timestamp)
+    rows = sorted(rows, key=attrgetter("timestamp"))
     base_profile = profile_for(tenor)
     fwd = _forward_returns(rows, horizons_min)
 
@@ -539,6 +539,13 @@ OPTION_BATCH_SIZE = _getenv_int("OPTION_BATCH_SIZE", 100)
 DELAY_BETWEEN_BATCHES = _getenv_float("DELAY_BETWEEN_BATCHES", 0.5)  # seconds
 DELAY_BETWEEN_BARS = _getenv_float("DELAY_BETWEEN_BARS", 1.0)  # seconds
 
+# Concurrent REST GETs for the option seed snapshot (quote batches) and for
+# the per-expiration strike ladders when building the tracked symbols. The
+# requests are independent, so a small pool overlaps their round-trips; the
+# client's rate-limit governor still gates every request. 1 = serial (legacy
+# pacing).
+OPTION_SEED_MAX_WORKERS = max(1, _getenv_int("OPTION_SEED_MAX_WORKERS", 4))
+
 # =============================================================================
 # Database Configuration
 # =============================================================================
@@ -8,19 +8,26 @@ Supports: .pgpass file, AWS Secrets Manager, and environment variables.
 import os
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
 from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Resolved once at import: Path.home() goes through expanduser ->
+# pwd.getpwuid() on POSIX, which is wasted work on every pool init. Honors
+# PGPASSFILE the same way libpq does.
+_PGPASS_PATH = Path(os.environ.get("PGPASSFILE") or (Path.home() / ".pgpass"))
+
 
 def get_db_password() -> Optional[str]:
     """
     Get database password from configured provider
 
-    Checks DB_PASSWORD_PROVIDER env var to determine which provider to use.
+    Uses the provider named by the DB_PASSWORD_PROVIDER env var, resolved once
+    at import (like the rest of the process-wide settings in src.config).
     Supported providers:
-    - 'pgpass' (default - uses ~/.pgpass file, no password needed in code)
+    - 'pgpass' (default - uses the PGPASSFILE / ~/.pgpass file, no password
+      needed in code)
     - 'aws_secrets_manager' (for AWS RDS deployments)
     - 'env' (direct from environment variable, not recommended for production)
 
@@ -30,19 +37,9 @@ def get_db_password() -> Optional[str]:
     Raises:
         ValueError: If password cannot be retrieved
     """
-    provider = os.getenv("DB_PASSWORD_PROVIDER", "pgpass")
-
-    logger.debug(f"Using password provider: {provider}")
-
-    if provider == "pgpass":
-        _get_password_from_pgpass()  # raises if .pgpass missing/misconfigured
-        return None
-    elif provider == "aws_secrets_manager":
-        return _get_password_from_aws_secrets_manager()
-    elif provider == "env":
-        return _get_password_from_env()
-    else:
-        raise ValueError(f"Unknown password provider: {provider}")
+    if _PROVIDER_FN is None:
+        raise ValueError(f"Unknown password provider: {_PROVIDER_NAME}")
+    return _PROVIDER_FN()
 
 
 def _get_password_from_pgpass() -> None:
@@ -50,7 +47,8 @@ def _get_password_from_pgpass() -> None:
     Use .pgpass file for authentication (PostgreSQL standard)
 
     When using .pgpass, we don't pass a password to psycopg2.
-    PostgreSQL client library automatically reads ~/.pgpass
+    PostgreSQL client library automatically reads the PGPASSFILE file
+    (default ~/.pgpass), the same path checked here
 
     Returns:
         None (psycopg2 will read .pgpass automatically)
@@ -58,28 +56,31 @@ def _get_password_from_pgpass() -> None:
     Raises:
         ValueError: If .pgpass file doesn't exist or has wrong permissions
     """
-    pgpass_path = Path.home() / ".pgpass"
+    pgpass_path = _PGPASS_PATH
 
-    if not pgpass_path.exists():
+    # One stat() covers both the existence and the permission check (EAFP),
+    # instead of exists() + stat() issuing two syscalls for the same file.
+    try:
+        pgpass_stat = os.stat(pgpass_path)
+    except FileNotFoundError:
         raise ValueError(
             f".pgpass file not found at {pgpass_path}\n"
-            "Create it with: nano ~/.pgpass\n"
+            f"Create it with: nano {pgpass_path}\n"
             "Format: hostname:port:database:username:password\n"
-            "Then run: chmod 600 ~/.pgpass"
-        )
+            f"Then run: chmod 600 {pgpass_path}"
+        ) from None
 
     # Check permissions (must be 0600)
-    pgpass_stat = pgpass_path.stat()
-    pgpass_mode = oct(pgpass_stat.st_mode)[-3:]
+    pgpass_mode = pgpass_stat.st_mode & 0o777
 
-    if pgpass_mode != "600":
+    if pgpass_mode != 0o600:
         raise ValueError(
-            f".pgpass file has incorrect permissions: {pgpass_mode}\n"
+            f".pgpass file has incorrect permissions: {pgpass_mode:o}\n"
             f"PostgreSQL requires exactly 600 (read/write for owner only)\n"
             f"Fix with: chmod 600 {pgpass_path}"
         )
 
-    logger.info(f"✅ Using .pgpass file for authentication: {pgpass_path}")
+    logger.info("✅ Using .pgpass file for authentication: %s", pgpass_path)
 
     # Return None - psycopg2 will automatically use .pgpass
     return None
@@ -109,7 +110,7 @@ def _get_password_from_aws_secrets_manager() -> str:
     if not secret_name:
         raise ValueError("DB_SECRET_NAME environment variable is required for AWS Secrets Manager")
 
-    logger.info(f"Fetching secret '{secret_name}' from AWS Secrets Manager")
+    logger.info("Fetching secret '%s' from AWS Secrets Manager", secret_name)
 
     try:
         # Create a Secrets Manager client
@@ -151,8 +152,11 @@ def _get_password_from_aws_secrets_manager() -> str:
         else:
             raise ValueError(f"Failed to retrieve secret: {e}")
     except Exception as e:
-        logger.error(f"Unexpected error retrieving password: {e}", exc_info=True)
-        raise ValueError(f"Failed to retrieve database password: {e}")
+        # No exc_info here: the ValueError below chains the original via
+        # ``from e``, so the traceback is rendered once by the final handler
+        # instead of being formatted on every failed attempt.
+        logger.error("Unexpected error retrieving password: %s", e)
+        raise ValueError(f"Failed to retrieve database password: {e}") from e
 
 
 def _get_password_from_env() -> str:
@@ -174,6 +178,27 @@ def _get_password_from_env() -> str:
     return password
 
 
+# Provider name -> retrieval function. The pgpass provider validates the file
+# and returns None (libpq reads it natively). New providers register here
+# without touching get_db_password().
+_PROVIDERS: Dict[str, Callable[[], Optional[str]]] = {
+    "pgpass": _get_password_from_pgpass,
+    "aws_secrets_manager": _get_password_from_aws_secrets_manager,
+    "env": _get_password_from_env,
+}
+
+# DB_PASSWORD_PROVIDER is fixed for the life of the process, so the dispatch
+# is specialised once here rather than re-read and re-validated per call. An
+# unknown name is reported now but only raised from get_db_password(), so
+# importing src.database stays safe for tooling that never connects.
+_PROVIDER_NAME = os.getenv("DB_PASSWORD_PROVIDER", "pgpass")
+_PROVIDER_FN: Optional[Callable[[], Optional[str]]] = _PROVIDERS.get(_PROVIDER_NAME)
+if _PROVIDER_FN is None:
+    logger.error("Unknown password provider: %s", _PROVIDER_NAME)
+else:
+    logger.debug("Using password provider: %s", _PROVIDER_NAME)
+
+
 def find_pgpass_entry(
     host: Optional[str] = None,
     port: Optional[str] = None,
@@ -181,7 +206,10 @@ def find_pgpass_entry(
     user: Optional[str] = None,
     pgpass_path: Optional[Path] = None,
 ) -> Optional[dict]:
-    """Return the first ``~/.pgpass`` entry matching the requested target.
+    """Return the first .pgpass entry matching the requested target.
+
+    The file is the one libpq would read: ``PGPASSFILE`` when set, else
+    ``~/.pgpass`` (``pgpass_path`` overrides it).
 
     Each argument constrains the match only when non-``None``; a field of ``*``
     in the file matches anything (standard PostgreSQL .pgpass semantics). This
@@ -196,7 +224,7 @@ def find_pgpass_entry(
     contain ``:`` (everything past the 4th colon). Backslash escapes are not
     interpreted (consistent with the prior hand-parser).
     """
-    path = pgpass_path or (Path.home() / ".pgpass")
+    path = pgpass_path or _PGPASS_PATH
     if not path.exists():
         return None
     try:
@@ -228,9 +256,10 @@ def resolve_db_credentials() -> dict:
     natively (e.g. asyncpg).
 
     The connection target (host/port/database/user) comes from the ``DB_*``
-    environment variables. The password is taken from the ``~/.pgpass`` line
-    that MATCHES that target — not the first line — so a multi-environment
-    .pgpass cannot connect the caller to the wrong database; it falls back to
+    environment variables. The password is taken from the .pgpass line (the
+    ``PGPASSFILE`` file, else ``~/.pgpass``) that MATCHES that target — not
+    the first line — so a multi-environment .pgpass cannot connect the caller
+    to the wrong database; it falls back to
     ``DB_PASSWORD`` when no line matches. When the ``DB_*`` vars are unset the
     match is unconstrained, preserving the prior first-line behavior.
 
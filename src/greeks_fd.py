@@ -43,14 +43,14 @@ import math
 _INV_SQRT2: float = 1.0 / math.sqrt(2.0)
 
 
-def _norm_cdf(x: float) -> float:
+def norm_cdf(x: float) -> float:
     """Standard-normal CDF via ``math.erf`` -- N(x) = 0.5*(1 + erf(x/sqrt(2))).
 
     Accurate to ~1e-15 (identical to ``scipy.stats.norm.cdf`` to machine
     precision) but ~50-100x faster per scalar call: no SciPy frozen-distribution
     dispatch, no NumPy scalar boxing. This matters because :func:`bsm_delta` is
     called hundreds of thousands of times per analytics cycle by the forced-flow
-    grid scans.
+    grid scans. Public so the ingestion Greeks price N(d) from the same kernel.
     """
     return 0.5 * (1.0 + math.erf(x * _INV_SQRT2))
 
@@ -92,9 +92,9 @@ def bsm_delta(
     discount = math.exp(-q * T)
 
     if option_type == "C":
-        return discount * _norm_cdf(d1)
+        return discount * norm_cdf(d1)
     # Put
-    return discount * (_norm_cdf(d1) - 1.0)
+    return discount * (norm_cdf(d1) - 1.0)
 
 
 def fd_vanna(
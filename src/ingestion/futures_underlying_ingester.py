@@ -46,7 +46,7 @@ from src.database import db_connection, close_connection_pool
 from src.config import _getenv_int, _getenv_bool, _getenv_str, API_REQUEST_TIMEOUT
 from src.market_calendar import is_futures_display_window
 from src.symbols import resolve_index_future
-from src.utils import get_logger
+from src.utils import get_logger, json_loads
 from src.validation import safe_float, safe_datetime
 
 logger = get_logger(__name__)
@@ -358,7 +358,7 @@ class FuturesUnderlyingIngester:
                 if not line:
                     continue
                 try:
-                    payload = json.loads(line)
+                    payload = json_loads(line)
                 except json.JSONDecodeError:
                     logger.warning(
                         "%s futures stream: JSON decode failed, skipping: %s",
@@ -4,15 +4,14 @@ Options Greeks Calculator for ZeroGEX
 Calculates Black-Scholes Greeks (delta, gamma, theta, vega) for options.
 Integrates with the ingestion pipeline to enrich option data before storage.
 
-Dependencies:
-    - numpy
-    - scipy (for stats.norm)
+Scalar math goes through ``math`` rather than NumPy: every call prices one
+quote, and NumPy ufunc dispatch on a Python float costs more than the
+operation itself.
 """
 
-import numpy as np
-from scipy import stats
+import math
 from datetime import datetime, date
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 from src.market_calendar import (
     ET,
@@ -22,12 +21,17 @@ from src.market_calendar import (
 )
 from src.utils import get_logger
 from src.config import RISK_FREE_RATE, DIVIDEND_YIELD, IMPLIED_VOLATILITY_DEFAULT
-from src.greeks_fd import bsm_delta, fd_charm, fd_vanna
+from src.greeks_fd import bsm_delta, fd_charm, fd_vanna, norm_cdf
 from src.ingestion.iv_calculator import IVCalculator
 from src.config import IV_CALCULATION_ENABLED
 
 logger = get_logger(__name__)
 
+# Standard-normal pdf is _INV_SQRT_2PI * exp(-x^2/2). Together with the
+# erf-based norm_cdf this keeps the per-quote Greeks off scipy.stats.norm,
+# whose frozen-distribution dispatch costs far more than the math itself.
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
 
 class GreeksCalculator:
     """
@@ -117,8 +121,8 @@ class GreeksCalculator:
         if S <= 0 or K <= 0 or T <= 0 or sigma <= 0:
             return (0.0, 0.0)
 
-        d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
+        d1 = (math.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
+        d2 = d1 - sigma * math.sqrt(T)
 
         return (d1, d2)
 
@@ -177,14 +181,7 @@ class GreeksCalculator:
         Returns:
             Gamma value
         """
-        if S <= 0 or sigma <= 0 or T <= 0:
-            return 0.0
-
-        d1, _ = self._calculate_d1_d2(S, K, T, r, sigma, q)
-
-        gamma = np.exp(-q * T) * stats.norm.pdf(d1) / (S * sigma * np.sqrt(T))
-
-        return gamma  # type: ignore[no-any-return]
+        return self._first_order_greeks(S, K, T, r, sigma, "C", q)[0]
 
     def calculate_theta(
         self,
@@ -214,30 +211,7 @@ class GreeksCalculator:
         Returns:
             Theta value (per day)
         """
-        if S <= 0 or K <= 0 or sigma <= 0 or T <= 0:
-            return 0.0
-
-        d1, d2 = self._calculate_d1_d2(S, K, T, r, sigma, q)
-
-        disc_q = np.exp(-q * T)
-        disc_r = np.exp(-r * T)
-        # BSM theta with continuous dividend yield q. The decay term carries
-        # the e^{-qT} factor; the q*S*e^{-qT}*N(±d1) term is the dividend
-        # carry. With q=0 this reduces to the prior dividend-free form.
-        decay = -S * disc_q * stats.norm.pdf(d1) * sigma / (2 * np.sqrt(T))
-        if option_type == "C":
-            theta = (
-                decay - r * K * disc_r * stats.norm.cdf(d2) + q * S * disc_q * stats.norm.cdf(d1)
-            )
-        else:  # Put
-            theta = (
-                decay + r * K * disc_r * stats.norm.cdf(-d2) - q * S * disc_q * stats.norm.cdf(-d1)
-            )
-
-        # Convert from per year to per day
-        theta_per_day = theta / 365.0
-
-        return theta_per_day  # type: ignore[no-any-return]
+        return self._first_order_greeks(S, K, T, r, sigma, option_type, q)[1]
 
     def calculate_vega(
         self, S: float, K: float, T: float, r: float, sigma: float, q: float = 0.0
@@ -259,15 +233,51 @@ class GreeksCalculator:
         Returns:
             Vega value (per 1% IV change)
         """
-        if S <= 0 or sigma <= 0 or T <= 0:
-            return 0.0
+        return self._first_order_greeks(S, K, T, r, sigma, "C", q)[2]
 
-        d1, _ = self._calculate_d1_d2(S, K, T, r, sigma, q)
+    def _first_order_greeks(
+        self,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        option_type: str,
+        q: float = 0.0,
+    ) -> Tuple[float, float, float]:
+        """Gamma, theta (per day) and vega (per 1% IV) in one pass.
+
+        The three share d1, n(d1), sqrt(T) and the e^{-qT} discount, so
+        they are evaluated once here instead of once per Greek. Degenerate
+        inputs (S/K/T/sigma <= 0) give all zeros.
+        """
+        if S <= 0 or K <= 0 or T <= 0 or sigma <= 0:
+            return (0.0, 0.0, 0.0)
+
+        sqrt_t = math.sqrt(T)
+        sig_sqrt_t = sigma * sqrt_t
+        d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / sig_sqrt_t
+        d2 = d1 - sig_sqrt_t
+        disc_q = math.exp(-q * T)
+        disc_q_pdf = disc_q * _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
 
-        # Vega per 1% change in volatility
-        vega = S * np.exp(-q * T) * stats.norm.pdf(d1) * np.sqrt(T) / 100.0
+        gamma = disc_q_pdf / (S * sig_sqrt_t)
+        # Vega per 1% change in volatility.
+        vega = S * disc_q_pdf * sqrt_t / 100.0
 
-        return vega  # type: ignore[no-any-return]
+        # BSM theta with continuous dividend yield q. The decay term carries
+        # the e^{-qT} factor; the q*S*e^{-qT}*N(±d1) term is the dividend
+        # carry. With q=0 this reduces to the prior dividend-free form.
+        decay = -S * disc_q_pdf * sigma / (2.0 * sqrt_t)
+        r_k_disc_r = r * K * math.exp(-r * T)
+        q_s_disc_q = q * S * disc_q
+        if option_type == "C":
+            theta = decay - r_k_disc_r * norm_cdf(d2) + q_s_disc_q * norm_cdf(d1)
+        else:  # Put
+            theta = decay + r_k_disc_r * norm_cdf(-d2) - q_s_disc_q * norm_cdf(-d1)
+
+        # Convert from per year to per day
+        return (gamma, theta / 365.0, vega)
 
     def calculate_vanna(
         self,
@@ -346,7 +356,7 @@ class GreeksCalculator:
         # Use defaults if not provided
         if implied_volatility is None:
             implied_volatility = self.default_iv
-            logger.debug(f"Using default IV: {implied_volatility:.4f}")
+            logger.debug("Using default IV: %.4f", implied_volatility)
 
         if risk_free_rate is None:
             risk_free_rate = self.risk_free_rate
@@ -387,15 +397,9 @@ class GreeksCalculator:
             delta = self.calculate_delta(
                 underlying_price, strike, T, risk_free_rate, implied_volatility, option_type, q
             )
-            gamma = self.calculate_gamma(
-                underlying_price, strike, T, risk_free_rate, implied_volatility, q
-            )
-            theta = self.calculate_theta(
+            gamma, theta, vega = self._first_order_greeks(
                 underlying_price, strike, T, risk_free_rate, implied_volatility, option_type, q
             )
-            vega = self.calculate_vega(
-                underlying_price, strike, T, risk_free_rate, implied_volatility, q
-            )
             # Second-order dealer-hedging Greeks (finite difference vs delta).
             charm = self.calculate_charm(
                 underlying_price, strike, T, risk_free_rate, implied_volatility, option_type, q
@@ -413,7 +417,7 @@ class GreeksCalculator:
                 "vanna": round(vanna, 8),
             }
 
-            logger.debug(f"Calculated Greeks for {option_type} {strike}: {greeks}")
+            logger.debug("Calculated Greeks for %s %s: %s", option_type, strike, greeks)
 
             return greeks
 
@@ -4,19 +4,17 @@ Implied Volatility Calculator for ZeroGEX
 Uses Newton-Raphson method to solve for implied volatility from option prices.
 Integrates with the existing GreeksCalculator for Black-Scholes calculations.
 
-Dependencies:
-    - numpy
-    - scipy (for stats.norm)
+The pricing and vega evaluated on every Newton iteration use the shared
+erf-based normal CDF (``src.greeks_fd.norm_cdf``) and an inline pdf rather
+than ``scipy.stats.norm``.
 """
 
 import math
 import time
-
-import numpy as np
-from scipy import stats
 from datetime import datetime, date
 from typing import Optional
 
+from src.greeks_fd import norm_cdf
 from src.market_calendar import ET, calculate_time_to_expiration
 from src.utils import get_logger
 from src.config import (
@@ -33,6 +31,9 @@ from src.config import (
 
 logger = get_logger(__name__)
 
+# Standard-normal pdf is _INV_SQRT_2PI * exp(-x^2/2).
+_INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
 
 class IVCalculator:
     """
@@ -168,15 +169,15 @@ class IVCalculator:
         if S <= 0 or K <= 0 or T <= 0 or sigma <= 0:
             return 0.0
 
-        d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        d2 = d1 - sigma * np.sqrt(T)
-        disc_q = np.exp(-q * T)
-        disc_r = np.exp(-r * T)
+        d1 = (math.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
+        d2 = d1 - sigma * math.sqrt(T)
+        disc_q = math.exp(-q * T)
+        disc_r = math.exp(-r * T)
 
         if option_type == "C":
-            price = S * disc_q * stats.norm.cdf(d1) - K * disc_r * stats.norm.cdf(d2)
+            price = S * disc_q * norm_cdf(d1) - K * disc_r * norm_cdf(d2)
         else:  # Put
-            price = K * disc_r * stats.norm.cdf(-d2) - S * disc_q * stats.norm.cdf(-d1)
+            price = K * disc_r * norm_cdf(-d2) - S * disc_q * norm_cdf(-d1)
 
         return price  # type: ignore[no-any-return]
 
@@ -188,8 +189,9 @@ class IVCalculator:
         if S <= 0 or K <= 0 or T <= 0 or sigma <= 0:
             return 0.0
 
-        d1 = (np.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-        vega = S * np.exp(-q * T) * stats.norm.pdf(d1) * np.sqrt(T)
+        d1 = (math.log(S / K) + (r - q + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
+        pdf_d1 = _INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+        vega = S * math.exp(-q * T) * pdf_d1 * math.sqrt(T)
 
         return vega  # type: ignore[no-any-return]
 
@@ -223,11 +225,11 @@ class IVCalculator:
         """
         # Validate inputs
         if option_price <= 0:
-            logger.debug(f"Invalid option price: {option_price}")
+            logger.debug("Invalid option price: %s", option_price)
             return None
 
         if underlying_price <= 0 or strike <= 0:
-            logger.debug(f"Invalid S={underlying_price} or K={strike}")
+            logger.debug("Invalid S=%s or K=%s", underlying_price, strike)
             return None
 
         # Calculate time to expiration
@@ -251,7 +253,7 @@ class IVCalculator:
             intrinsic = max(0, discounted_strike - discounted_spot)
 
         if option_price < intrinsic * 0.99:  # Allow small discrepancy
-            logger.debug(f"Option price ({option_price}) < intrinsic value ({intrinsic})")
+            logger.debug("Option price (%s) < intrinsic value (%s)", option_price, intrinsic)
             return None
 
         # Newton-Raphson iteration
@@ -279,7 +281,7 @@ class IVCalculator:
 
             # Check convergence
             if abs(price_diff) < self.tolerance:
-                logger.debug(f"IV converged in {iteration+1} iterations: {sigma:.4f}")
+                logger.debug("IV converged in %d iterations: %.4f", iteration + 1, sigma)
                 return sigma
 
             # Calculate vega (derivative)
@@ -333,8 +335,9 @@ class IVCalculator:
                 sigma = self.min_iv
                 if prev_at_floor:
                     logger.debug(
-                        f"IV solver saturated at floor {self.min_iv:.4f}; "
-                        "treating as non-convergence (returning None)"
+                        "IV solver saturated at floor %.4f; "
+                        "treating as non-convergence (returning None)",
+                        self.min_iv,
                     )
                     return None
             elif sigma > self.max_iv:
@@ -344,12 +347,13 @@ class IVCalculator:
                 sigma = self.max_iv
                 if prev_at_ceiling:
                     logger.debug(
-                        f"IV solver saturated at ceiling {self.max_iv:.4f}; "
-                        "treating as non-convergence (returning None)"
+                        "IV solver saturated at ceiling %.4f; "
+                        "treating as non-convergence (returning None)",
+                        self.max_iv,
                     )
                     return None
 
-        logger.debug(f"IV did not converge after {self.max_iterations} iterations")
+        logger.debug("IV did not converge after %d iterations", self.max_iterations)
         return None
 
     def calculate_iv_from_bid_ask(
@@ -377,7 +381,7 @@ class IVCalculator:
         """
         # Validate bid/ask
         if bid <= 0 or ask <= 0 or ask < bid:
-            logger.debug(f"Invalid bid/ask: {bid}/{ask}")
+            logger.debug("Invalid bid/ask: %s/%s", bid, ask)
             return None
 
         # Use mid-price
@@ -389,7 +393,7 @@ class IVCalculator:
         # is conservative; any caller who genuinely wants the loose-quote
         # IV can still call calculate_iv() directly with their own price).
         if (ask - bid) / mid_price > 0.5:
-            logger.debug(f"Spread too wide: bid={bid} ask={ask} mid={mid_price}")
+            logger.debug("Spread too wide: bid=%s ask=%s mid=%s", bid, ask, mid_price)
             return None
 
         return self.calculate_iv(
@@ -438,7 +442,7 @@ class IVCalculator:
         # If API already provided a positive IV, use it.
         iv = option_data.get("implied_volatility")
         if iv is not None and iv > 0:
-            logger.debug(f"Using API-provided IV: {iv:.4f}")
+            logger.debug("Using API-provided IV: %.4f", iv)
             return option_data
 
         # Extract required fields
@@ -488,11 +492,11 @@ class IVCalculator:
         if calculated_iv:
             option_data["implied_volatility"] = calculated_iv
             logger.debug(
-                f"Calculated IV for {option_data.get('option_symbol')}: {calculated_iv:.4f}"
+                "Calculated IV for %s: %.4f", option_data.get("option_symbol"), calculated_iv
             )
         else:
             option_data["implied_volatility"] = None
-            logger.debug(f"Could not calculate IV for {option_data.get('option_symbol')}")
+            logger.debug("Could not calculate IV for %s", option_data.get("option_symbol"))
 
         return option_data
 
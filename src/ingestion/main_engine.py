@@ -524,7 +524,7 @@ class IngestionEngine:
                 )
                 logger.info("   Greeks calculation can now proceed for options")
             elif self.underlying_bars_stored % 10 == 0:  # Log every 10 bars
-                logger.debug(f"Underlying price updated: ${self.latest_underlying_price:.2f}")
+                logger.debug("Underlying price updated: $%.2f", self.latest_underlying_price)
 
     def _repair_session_open_if_needed(self, bucket: datetime) -> None:
         """De-phantom the cash-index 09:30 ET open bar once it's complete.
@@ -669,6 +669,10 @@ class IngestionEngine:
         rolls back only the savepoint; the upsert still commits.
         """
         try:
+            # One .get() per field, bound locally; no per-field helper call.
+            get = quote.get
+            open_, high, low, close = get("open"), get("high"), get("low"), get("close")
+            up_volume, down_volume = get("up_volume"), get("down_volume")
             payload = {
                 "symbol": quote["symbol"],
                 "timestamp": (
@@ -676,14 +680,12 @@ class IngestionEngine:
                     if hasattr(quote["timestamp"], "isoformat")
                     else str(quote["timestamp"])
                 ),
-                "open": float(quote["open"]) if quote.get("open") is not None else None,
-                "high": float(quote["high"]) if quote.get("high") is not None else None,
-                "low": float(quote["low"]) if quote.get("low") is not None else None,
-                "close": float(quote["close"]) if quote.get("close") is not None else None,
-                "up_volume": int(quote["up_volume"]) if quote.get("up_volume") is not None else None,
-                "down_volume": (
-                    int(quote["down_volume"]) if quote.get("down_volume") is not None else None
-                ),
+                "open": float(open_) if open_ is not None else None,
+                "high": float(high) if high is not None else None,
+                "low": float(low) if low is not None else None,
+                "close": float(close) if close is not None else None,
+                "up_volume": int(up_volume) if up_volume is not None else None,
+                "down_volume": int(down_volume) if down_volume is not None else None,
                 "asset_type": self._lookup_asset_type(cursor, quote["symbol"]),
             }
             body = json.dumps(payload, separators=(",", ":"), default=str)
@@ -1913,7 +1915,7 @@ class IngestionEngine:
                         )
 
             logger.debug(
-                f"Wrote {len(rows)} option rows in single transaction " f"({elapsed_ms:.1f}ms)"
+                "Wrote %d option rows in single transaction (%.1fms)", len(rows), elapsed_ms
             )
 
             # Periodic observability summary (every 60s).
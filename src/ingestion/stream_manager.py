@@ -16,17 +16,20 @@ Storage is handled by IngestionEngine.
 """
 
 import json
+import logging
 import os
 import random
 import threading
 import time
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timezone
-from typing import Generator, List, Dict, Any, Optional, Set
+from typing import Generator, List, Dict, Any, Optional, Set, Tuple
 import pytz
 import requests as _requests
 
-from src.ingestion.tradestation_client import TradeStationClient
-from src.utils import get_logger
+from src.ingestion.tradestation_client import TradeStationClient, format_option_symbol
+from src.utils import get_logger, json_loads
 from src.validation import (
     safe_float,
     safe_int,
@@ -36,13 +39,14 @@ from src.validation import (
     underlying_feed_expected,
 )
 from src.symbols import resolve_option_root, is_cash_index, resolve_monthly_underlying
-from src.market_calendar import is_underlying_active_session
+from src.market_calendar import REGULAR_CLOSE, is_underlying_active_session
 from src.config import (
     _getenv_str,
     _getenv_int,
     _getenv_bool,
     _getenv_float,
     OPTION_BATCH_SIZE,
+    OPTION_SEED_MAX_WORKERS,
     DELAY_BETWEEN_BATCHES,
     MARKET_HOURS_POLL_INTERVAL,
     EXTENDED_HOURS_POLL_INTERVAL,
@@ -538,22 +542,50 @@ class OptionStreamAccumulator:
     # -- internal ----------------------------------------------------------
 
     def _seed_from_rest(self):
-        """Fetch one full REST snapshot to populate OI, IV, and prices."""
+        """Fetch one full REST snapshot to populate OI, IV, and prices.
+
+        The batches are independent GETs, so with ``OPTION_SEED_MAX_WORKERS``
+        > 1 they are issued on a small thread pool and their round-trips
+        overlap; pacing is left to the client's rate-limit governor, which
+        gates every request. With a single worker this is the serial loop,
+        spacing batch *starts* at least ``DELAY_BETWEEN_BATCHES`` apart: a
+        batch that took longer than the delay starts the next one at once,
+        and nothing waits after the last batch.
+        """
         logger.info(f"Seeding option state from REST ({len(self._symbols)} symbols)...")
+        batches = [
+            self._symbols[i : i + OPTION_BATCH_SIZE]
+            for i in range(0, len(self._symbols), OPTION_BATCH_SIZE)
+        ]
         seeded = 0
-        for i in range(0, len(self._symbols), OPTION_BATCH_SIZE):
-            batch = self._symbols[i : i + OPTION_BATCH_SIZE]
-            try:
-                data = self._client.get_option_quotes(batch)
-                for q in data.get("Quotes", []):
+        workers = min(OPTION_SEED_MAX_WORKERS, len(batches))
+        if workers <= 1:
+            next_start = 0.0
+            for batch in batches:
+                wait = next_start - time.monotonic()
+                if wait > 0:
+                    time.sleep(wait)
+                next_start = time.monotonic() + DELAY_BETWEEN_BATCHES
+                for q in self._fetch_seed_batch(batch):
                     self._merge_single_quote(q)
                     seeded += 1
-            except Exception as e:
-                logger.warning(f"REST seed batch failed: {e}")
-            if DELAY_BETWEEN_BATCHES > 0:
-                time.sleep(DELAY_BETWEEN_BATCHES)
+        else:
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="option-seed") as ex:
+                for quotes in ex.map(self._fetch_seed_batch, batches):
+                    for q in quotes:
+                        self._merge_single_quote(q)
+                        seeded += 1
         logger.info(f"REST seed complete: {seeded} quotes loaded")
 
+    def _fetch_seed_batch(self, batch: List[str]) -> List[Dict[str, Any]]:
+        """Fetch one REST quote batch; a failed batch seeds nothing."""
+        try:
+            quotes: List[Dict[str, Any]] = self._client.get_option_quotes(batch).get("Quotes", [])
+            return quotes
+        except Exception as e:
+            logger.warning(f"REST seed batch failed: {e}")
+            return []
+
     def _reader_loop(self, chunk_idx: int, chunk_symbols: List[str]):
         """Continuously read stream events for one chunk; auto-reconnect on failure."""
         label = (
@@ -708,7 +740,7 @@ class OptionStreamAccumulator:
                     continue
 
                 try:
-                    payload = json.loads(line)
+                    payload = json_loads(line)
                 except json.JSONDecodeError:
                     decode_tracker.record(line)
                     continue
@@ -1082,7 +1114,7 @@ class UnderlyingBarAccumulator:
                     continue
 
                 try:
-                    payload = json.loads(line)
+                    payload = json_loads(line)
                 except json.JSONDecodeError:
                     decode_tracker.record(line)
                     continue
@@ -1310,6 +1342,9 @@ class StreamManager:
         # Pre-parsed metadata (strike, expiration, option_type) per option symbol
         # so we don't re-parse the symbol string every poll cycle.
         self._symbol_metadata: Dict[str, Dict[str, Any]] = {}
+        # expiration -> (strikes-endpoint "MM-DD-YYYY", option-symbol "YYMMDD").
+        # The same handful of expirations is formatted on every recalc.
+        self._exp_str_cache: Dict[date, Tuple[str, str]] = {}
 
         # Shared wakeup event — either accumulator sets this when new data arrives
         # so the main loop can react immediately instead of sleeping a fixed interval.
@@ -1353,6 +1388,9 @@ class StreamManager:
         # whole session rather than just trades since the last recalc reset.
         self._session_volume_symbols: Set[str] = set()
         self._session_volume_date: Optional[date] = None
+        # (call site, exception type) pairs whose traceback has been logged;
+        # see _log_error.
+        self._traceback_logged: Set[Tuple[str, str]] = set()
 
         logger.info(f"Initialized StreamManager for {underlying}")
         logger.info(
@@ -1429,12 +1467,12 @@ class StreamManager:
             }
 
             logger.debug(
-                f"Bar (REST): {self.underlying} @ {timestamp} " f"C=${underlying_data['close']:.2f}"
+                "Bar (REST): %s @ %s C=$%.2f", self.underlying, timestamp, underlying_data["close"]
             )
             return underlying_data
 
         except Exception as e:
-            logger.error(f"Error fetching underlying bar: {e}", exc_info=True)
+            self._log_error("underlying_bar", f"Error fetching underlying bar: {e}", e)
             return None
 
     def _get_underlying_price(self) -> Optional[float]:
@@ -1456,7 +1494,7 @@ class StreamManager:
             return None
 
         except Exception as e:
-            logger.error(f"Error fetching underlying price: {e}", exc_info=True)
+            self._log_error("underlying_price", f"Error fetching underlying price: {e}", e)
             return None
 
     def _should_refresh_expirations(self) -> bool:
@@ -1488,7 +1526,7 @@ class StreamManager:
 
         # Check if we've crossed 4:00 PM ET since last refresh
         last_refresh_et = self.last_expiration_refresh.astimezone(ET)
-        market_close_time = datetime.strptime("16:00:00", "%H:%M:%S").time()
+        market_close_time = REGULAR_CLOSE
 
         # If last refresh was before today's 4:00 PM and now is after 4:00 PM
         if last_refresh_et.date() < now_et.date() or (
@@ -1632,7 +1670,7 @@ class StreamManager:
             return target_exps
 
         except Exception as e:
-            logger.error(f"Error fetching expirations: {e}", exc_info=True)
+            self._log_error("expirations", f"Error fetching expirations: {e}", e)
             return []
 
     def _fetch_chain_expirations(
@@ -1658,6 +1696,14 @@ class StreamManager:
             return []
         return future[:limit]
 
+    def _expiration_strs(self, expiration: date) -> Tuple[str, str]:
+        """Cached ``("MM-DD-YYYY", "YYMMDD")`` renderings of ``expiration``."""
+        strs = self._exp_str_cache.get(expiration)
+        if strs is None:
+            strs = (expiration.strftime("%m-%d-%Y"), expiration.strftime("%y%m%d"))
+            self._exp_str_cache[expiration] = strs
+        return strs
+
     def _get_strikes_near_price(
         self,
         expiration: date,
@@ -1682,7 +1728,7 @@ class StreamManager:
             chains = self._expiration_underlying.get(expiration, [self.underlying])
             ts_symbol = chains[0] if chains else self.underlying
         try:
-            exp_str = expiration.strftime("%m-%d-%Y")
+            exp_str = self._expiration_strs(expiration)[0]
             all_strikes = self.client.get_option_strikes(ts_symbol, expiration=exp_str)
 
             if not all_strikes:
@@ -1692,31 +1738,36 @@ class StreamManager:
             pct = self.strike_pct_range / 100.0
             low = current_price * (1.0 - pct)
             high = current_price * (1.0 + pct)
-            in_band = [s for s in all_strikes if low <= s <= high]
+            # The client returns the ladder ascending, so the band is a
+            # contiguous slice found in O(log N) instead of a full scan.
+            in_band = all_strikes[bisect_left(all_strikes, low) : bisect_right(all_strikes, high)]
 
             trimmed_count = 0
             if len(in_band) > self.strike_count_max:
                 trimmed_count = len(in_band) - self.strike_count_max
                 in_band.sort(key=lambda s: abs(s - current_price))
                 in_band = in_band[: self.strike_count_max]
-
-            nearby_strikes = sorted(in_band)
-            below = sum(1 for s in nearby_strikes if s <= current_price)
-            above = len(nearby_strikes) - below
-
-            log_msg = (
-                f"Exp {exp_str} ({ts_symbol}): {len(nearby_strikes)} strikes "
-                f"({below} below, {above} above ${current_price:.2f}) "
-                f"within ±{self.strike_pct_range}% [{low:.2f}, {high:.2f}]"
-            )
-            if trimmed_count:
-                log_msg += f"; trimmed {trimmed_count} furthest at cap {self.strike_count_max}"
-            logger.debug(log_msg)
+                in_band.sort()
+
+            nearby_strikes = in_band
+            # Runs per expiration per chain on every recalc; skip building the
+            # summary entirely unless DEBUG is actually enabled.
+            if logger.isEnabledFor(logging.DEBUG):
+                below = bisect_right(nearby_strikes, current_price)
+                above = len(nearby_strikes) - below
+                log_msg = (
+                    f"Exp {exp_str} ({ts_symbol}): {len(nearby_strikes)} strikes "
+                    f"({below} below, {above} above ${current_price:.2f}) "
+                    f"within ±{self.strike_pct_range}% [{low:.2f}, {high:.2f}]"
+                )
+                if trimmed_count:
+                    log_msg += f"; trimmed {trimmed_count} furthest at cap {self.strike_count_max}"
+                logger.debug(log_msg)
 
             return nearby_strikes
 
         except Exception as e:
-            logger.error(f"Error fetching strikes for {expiration}: {e}", exc_info=True)
+            self._log_error("strikes", f"Error fetching strikes for {expiration}: {e}", e)
             return []
 
     def _build_option_symbols(self) -> List[str]:
@@ -1733,39 +1784,112 @@ class StreamManager:
             logger.warning("No current price, cannot build option symbols")
             return []
 
-        option_symbols = []
+        option_symbols: List[str] = []
         self.tracked_strikes = set()
         self.all_tracked_strikes = {}
-        self._symbol_metadata = {}
+        # Locals for the per-contract loop below (runs strikes x 2 per chain).
+        metadata: Dict[str, Dict[str, Any]] = {}
+        self._symbol_metadata = metadata
+        append_symbol = option_symbols.append
+
+        pairs = [
+            (expiration, ts_symbol)
+            for expiration in self.target_expirations
+            for ts_symbol in self._expiration_underlying.get(expiration, [self.underlying])
+        ]
+        strikes_by_pair = self._fetch_strike_bands(pairs, self.current_price)
 
         for expiration in self.target_expirations:
             ts_chains = self._expiration_underlying.get(expiration, [self.underlying])
             union_strikes: set = set()
 
             for ts_symbol in ts_chains:
-                strikes = self._get_strikes_near_price(
-                    expiration, self.current_price, ts_symbol=ts_symbol
-                )
+                strikes = strikes_by_pair[(expiration, ts_symbol)]
                 union_strikes.update(strikes)
 
+                # Root and expiration code are fixed for the whole ladder, so
+                # resolve them once here rather than per contract.
+                option_root = resolve_option_root(ts_symbol)
+                exp_code = self._expiration_strs(expiration)[1]
                 for strike in strikes:
                     for opt_type in ("C", "P"):
-                        symbol = self.client.build_option_symbol(
-                            ts_symbol, expiration, opt_type, strike
-                        )
-                        option_symbols.append(symbol)
-                        self.tracked_strikes.add(strike)
-                        self._symbol_metadata[symbol] = {
+                        symbol = format_option_symbol(option_root, exp_code, opt_type, strike)
+                        # A repeated strike (e.g. "600" and "600.0" from the
+                        # strikes endpoint) or two chains resolving to the
+                        # same root would otherwise subscribe the contract
+                        # twice and spend a quote-batch slot on it.
+                        if symbol in metadata:
+                            continue
+                        append_symbol(symbol)
+                        metadata[symbol] = {
                             "strike": strike,
                             "expiration": expiration,
                             "option_type": opt_type,
                         }
 
             self.all_tracked_strikes[expiration] = union_strikes
+            self.tracked_strikes.update(union_strikes)
 
         logger.info(f"Built {len(option_symbols)} option symbols to track")
         return option_symbols
 
+    def _fetch_strike_bands(
+        self, pairs: List[Tuple[date, str]], current_price: float
+    ) -> Dict[Tuple[date, str], List[float]]:
+        """Strike band per (expiration, TS chain) pair, fetched concurrently.
+
+        Each pair whose ladder is not in the client's strikes cache is an
+        independent strikes GET, so with ``OPTION_SEED_MAX_WORKERS`` > 1 the
+        misses overlap on a small pool instead of costing one round-trip each
+        in series; the client's rate-limit governor still gates every request.
+        Cached pairs are resolved inline, so a warm-cache recalibration never
+        spins up a pool.
+        """
+
+        def _band(pair: Tuple[date, str]) -> List[float]:
+            return self._get_strikes_near_price(pair[0], current_price, ts_symbol=pair[1])
+
+        misses = [
+            pair
+            for pair in pairs
+            if not self.client.has_cached_strikes(pair[1], self._expiration_strs(pair[0])[0])
+        ]
+        workers = min(OPTION_SEED_MAX_WORKERS, len(misses))
+        if workers <= 1:
+            return {pair: _band(pair) for pair in pairs}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="strike-fetch") as ex:
+            fetched = dict(zip(misses, ex.map(_band, misses)))
+        return {pair: fetched[pair] if pair in fetched else _band(pair) for pair in pairs}
+
+    def _log_error(self, site: str, message: str, exc: BaseException) -> None:
+        """Log ``message`` at ERROR, with a traceback only the first time.
+
+        The fetch paths fail in bursts (rate-limit storms, upstream 5xx) and
+        fire every cycle or every expiration while they last; formatting the
+        same traceback each time is pure overhead. The first occurrence of
+        each exception type at each ``site`` keeps ``exc_info`` for
+        diagnosis, repeats log the one-line message only.
+        """
+        key = (site, type(exc).__name__)
+        if key in self._traceback_logged:
+            logger.error(message)
+            return
+        self._traceback_logged.add(key)
+        logger.error(message, exc_info=True)
+
+    def _recalibrate_strikes(self, new_price: float) -> bool:
+        """Re-centre the strike band on ``new_price``; True if symbols changed.
+
+        Between recalcs spot usually drifts less than one strike step, so
+        the rebuilt ladder is identical to the tracked one. Callers use the
+        return value to skip the option-bucket flush and accumulator restart
+        (a full stream reconnect per chunk) when nothing would change.
+        """
+        self.current_price = new_price
+        previous = self.tracked_option_symbols
+        self.tracked_option_symbols = self._build_option_symbols()
+        return self.tracked_option_symbols != previous
+
     def _update_session_volume_coverage(
         self,
         changed_state: Dict[str, Dict[str, Any]],
@@ -1774,12 +1898,14 @@ class StreamManager:
     ) -> float:
         """Session-cumulative fraction of the CURRENT tracked universe trading.
 
-        The per-cycle option accumulator is torn down and rebuilt WITHOUT a
-        REST re-seed every ``STRIKE_RECALC_INTERVAL`` (~60s at the default 5s
-        poll), zeroing its in-memory ``Volume``. Counting ``Volume>0`` straight
-        off the accumulator therefore only ever reflects ~1 minute of trades
-        and reads far below the true session figure (~80% measured) — the
-        chronic false positive behind the "Low option volume coverage" alert.
+        Whenever a strike recalibration (checked every
+        ``STRIKE_RECALC_INTERVAL``, ~60s at the default 5s poll) changes the
+        tracked symbol set, the option accumulator is torn down and rebuilt
+        WITHOUT a REST re-seed, zeroing its in-memory ``Volume``. Counting
+        ``Volume>0`` straight off the accumulator therefore only reflects the
+        trades since the last band change and, on a drifting day, reads far
+        below the true session figure (~80% measured) — the chronic false
+        positive behind the "Low option volume coverage" alert.
 
         Instead, accumulate the set of symbols seen with ``Volume>0`` on the
         StreamManager (it survives the accumulator swaps) and reset it at the ET
@@ -1854,6 +1980,8 @@ class StreamManager:
         for exp in expired:
             del self.all_tracked_strikes[exp]
             logger.debug(f"Cleaned up strikes for expired expiration: {exp}")
+        for exp in [e for e in self._exp_str_cache if e < today]:
+            del self._exp_str_cache[exp]
 
     def _validate_option_quote_symbol(self) -> bool:
         """Validate at least one built option symbol returns a quote without API symbol errors."""
@@ -2048,8 +2176,11 @@ class StreamManager:
                 return []
 
         results = []
+        # Bound once: the loop body runs per drained contract every cycle.
+        get_meta = self._symbol_metadata.get
+        db_underlying = self.db_underlying
         for option_symbol, raw in state.items():
-            meta = self._symbol_metadata.get(option_symbol)
+            meta = get_meta(option_symbol)
             if not meta:
                 continue
 
@@ -2124,7 +2255,7 @@ class StreamManager:
                 {
                     "option_symbol": option_symbol,
                     "timestamp": timestamp,
-                    "underlying": self.db_underlying,
+                    "underlying": db_underlying,
                     "strike": meta["strike"],
                     "expiration": meta["expiration"],
                     "option_type": meta["option_type"],
@@ -2567,9 +2698,7 @@ class StreamManager:
                     if iteration % STRIKE_RECALC_INTERVAL == 0 and iteration > 0:
                         if self.current_price:
                             new_price = self._get_underlying_price()
-                            if new_price:
-                                self.current_price = new_price
-                                self.tracked_option_symbols = self._build_option_symbols()
+                            if new_price and self._recalibrate_strikes(new_price):
                                 # C3: flush the consumer's pending option
                                 # buckets BEFORE swapping accumulators —
                                 # contracts dropped from the recalibrated
@@ -2591,6 +2720,12 @@ class StreamManager:
                                     f"(±{self.strike_pct_range}% band, "
                                     f"max {self.strike_count_max} strikes/exp)"
                                 )
+                            elif new_price:
+                                logger.debug(
+                                    "Strike recalc around $%.2f: tracked set unchanged, "
+                                    "keeping option streams",
+                                    new_price,
+                                )
 
                     # Cleanup expired strikes periodically
                     if iteration % STRIKE_CLEANUP_INTERVAL == 0:
@@ -2602,7 +2737,7 @@ class StreamManager:
                         break
 
                 except Exception as e:
-                    logger.error(f"Stream iteration error: {e}", exc_info=True)
+                    self._log_error("stream_iteration", f"Stream iteration error: {e}", e)
                     time.sleep(max_wait)
         finally:
             # Always clean up the background stream threads.
@@ -5,6 +5,7 @@ Comprehensive client for TradeStation Market Data API v3 with retry logic.
 Updated with Stream Bars endpoint for real-time volume tracking.
 """
 
+import logging
 import os
 import requests
 import time
@@ -13,13 +14,21 @@ from typing import Optional, List, Dict, Any, Union, Callable
 import pytz
 import json
 from requests import Response
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from threading import Lock
 
 from src.ingestion.tradestation_auth import TradeStationAuth
-from src.utils import get_logger
+from src.utils import HAS_FAST_JSON, get_logger, json_loads
 from src.validation import safe_float, safe_int
 from src.symbols import parse_underlyings, resolve_option_root
-from src.market_calendar import NYSE_HOLIDAYS
+from src.market_calendar import (
+    EXTENDED_CLOSE,
+    EXTENDED_OPEN,
+    HALF_DAY_CLOSE,
+    NYSE_HOLIDAYS,
+    REGULAR_CLOSE,
+    REGULAR_OPEN,
+)
 from src.config import (
     _getenv_str,
     _getenv_int,
@@ -28,6 +37,7 @@ from src.config import (
     API_RETRY_ATTEMPTS,
     API_RETRY_DELAY,
     API_RETRY_BACKOFF,
+    OPTION_SEED_MAX_WORKERS,
     TS_RATE_LIMIT_PER_5MIN,
     TS_RATE_LIMIT_SYNC_INTERVAL,
     TS_STRIKES_CACHE_TTL,
@@ -67,6 +77,49 @@ def _load_nyse_half_days() -> set:
 NYSE_HALF_DAYS = _load_nyse_half_days()
 
 
+def _new_http_session() -> requests.Session:
+    """Build the client's keep-alive REST Session with a sized HTTPS pool.
+
+    urllib3 keeps at most ``pool_maxsize`` idle connections per host and
+    discards (then re-handshakes) the rest, so the pool must cover the
+    concurrent REST seed workers plus the odd strike/bar call from the main
+    loop. Retries stay off at the transport level: ``_request`` owns the
+    retry/backoff and 401-refresh policy.
+    """
+    session = requests.Session()
+    pool_size = max(DEFAULT_POOLSIZE, OPTION_SEED_MAX_WORKERS + 2)
+    session.mount("https://", HTTPAdapter(pool_maxsize=pool_size))
+    return session
+
+
+def _decode_response_json(response: Response) -> Any:
+    """Decode a successful response body, via orjson when it is installed.
+
+    Quote/bar payloads are the bulk of the client's CPU time; orjson parses
+    the raw bytes directly instead of going through ``Response.json()``'s
+    text decode + stdlib parser. Anything exposing a ``bytes`` ``.content``
+    takes that path; only objects without one fall back to ``.json()``.
+    """
+    content = getattr(response, "content", None)
+    if HAS_FAST_JSON and isinstance(content, (bytes, bytearray)):
+        return json_loads(content)
+    return response.json()
+
+
+def format_option_symbol(option_root: str, exp_code: str, option_type: str, strike: float) -> str:
+    """Format a TradeStation option symbol from pre-resolved parts.
+
+    ``option_root`` is the already-resolved chain root and ``exp_code`` the
+    ``YYMMDD`` expiration, so callers building a whole strike ladder resolve
+    them once per expiration instead of once per contract.
+    """
+    if strike == int(strike):
+        strike_str = str(int(strike))
+    else:
+        strike_str = f"{strike:.2f}"
+    return f"{option_root} {exp_code}{option_type}{strike_str}"
+
+
 class TradeStationClient:
     """Comprehensive client for TradeStation Market Data API with retry logic"""
 
@@ -82,6 +135,11 @@ class TradeStationClient:
         self.base_url = self.SANDBOX_URL if sandbox else self.BASE_URL
         self.auth = TradeStationAuth(client_id, client_secret, refresh_token, sandbox)
         self.sandbox = sandbox
+        # One keep-alive Session for the REST endpoints so back-to-back quote
+        # / strike / bar requests reuse pooled connections instead of paying
+        # a TCP + TLS handshake each. Stream endpoints keep their own
+        # dedicated connections (requests.get(stream=True)) below.
+        self._http = _new_http_session()
         self._stream_lock = Lock()
         self._stream_state: Dict[str, Dict[str, Any]] = {}
         self._api_session_counter_lock = Lock()
@@ -465,8 +523,9 @@ class TradeStationClient:
         """
         Track each new HTTPS session open to api.tradestation.com in 5-min windows.
 
-        This increments once per outbound `requests.request/get` invocation in this
-        client. When the 5-minute bucket rolls, it logs the completed bucket count.
+        This increments once per outbound request in this client (REST calls
+        through the pooled session, and stream opens via `requests.get`).
+        When the 5-minute bucket rolls, it logs the completed bucket count.
         """
         tracked_hosts = ("api.tradestation.com", "sim-api.tradestation.com")
         if not any(host in self.base_url for host in tracked_hosts):
@@ -565,7 +624,7 @@ class TradeStationClient:
         headers = self.auth.get_headers()
         headers["Content-Type"] = "application/json"
 
-        logger.debug(f"{method} {endpoint} (attempt {retry_count + 1}/{API_RETRY_ATTEMPTS})")
+        logger.debug("%s %s (attempt %d/%d)", method, endpoint, retry_count + 1, API_RETRY_ATTEMPTS)
 
         try:
             response = self._build_request_response(method, url, headers, params, data)
@@ -601,8 +660,11 @@ class TradeStationClient:
                     else:
                         return {}
 
-                result = response.json()
-                logger.debug(f"Response: {json.dumps(result, indent=2)[:1000]}...")
+                result = _decode_response_json(response)
+                # Re-serialising the whole payload is far costlier than the
+                # log line is worth, so only do it when DEBUG is on.
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response: %s...", json.dumps(result, indent=2)[:1000])
                 return result  # type: ignore[no-any-return]
 
             # Handle expired/invalid token - force refresh and retry once.
@@ -733,7 +795,7 @@ class TradeStationClient:
         self._gate_for_resource(endpoint_for_gate)
         self._gate_for_rate_limit()
         self._record_api_https_session_open()
-        return requests.request(
+        return self._http.request(
             method=method,
             url=url,
             headers=headers,
@@ -758,7 +820,7 @@ class TradeStationClient:
             line = self._next_stream_json_line(stream_key, state)
             if line is None:
                 return {}
-            return json.loads(line)  # type: ignore[no-any-return]
+            return json_loads(line)  # type: ignore[no-any-return]
         except StopIteration:
             # Stream endpoints may rotate/terminate connections. Treat this as a
             # normal reconnect event instead of warning-level noise.
@@ -1082,8 +1144,9 @@ class TradeStationClient:
         expirations = []
         if "Expirations" in result:
             for exp in result["Expirations"]:
-                exp_date = datetime.strptime(exp["Date"], "%Y-%m-%dT%H:%M:%SZ").date()
-                expirations.append(exp_date)
+                # "YYYY-MM-DDT00:00:00Z": the date prefix is all we keep, and
+                # fromisoformat on it is far cheaper than strptime's parser.
+                expirations.append(date.fromisoformat(exp["Date"][:10]))
 
         logger.info(f"Found {len(expirations)} expirations")
         return sorted(expirations)
@@ -1100,6 +1163,9 @@ class TradeStationClient:
         ``TS_STRIKES_CACHE_TTL`` seconds.  Empty results are NOT cached so a
         transient upstream failure can't poison the cache for an hour.  Set
         the TTL to 0 to disable.
+
+        Strikes are returned in ascending order (sorted once here, before
+        caching) so callers can band-select them with ``bisect``.
         """
         cache_key = self._strikes_cache_key(underlying, expiration)
         if TS_STRIKES_CACHE_TTL > 0:
@@ -1141,6 +1207,7 @@ class TradeStationClient:
                 strikes.append(parsed)
             if bad:
                 logger.warning("Skipped %d malformed strike rows for %s", bad, underlying)
+            strikes.sort()
 
         logger.info(f"Found {len(strikes)} strikes")
 
@@ -1174,13 +1241,22 @@ class TradeStationClient:
             for key in [k for k in self._strikes_cache if k.startswith(prefix)]:
                 self._strikes_cache.pop(key, None)
 
+    def has_cached_strikes(self, underlying: str, expiration: Optional[str] = None) -> bool:
+        """True if :meth:`get_option_strikes` would answer from the cache."""
+        if TS_STRIKES_CACHE_TTL <= 0:
+            return False
+        key = self._strikes_cache_key(underlying, expiration)
+        with self._strikes_cache_lock:
+            entry = self._strikes_cache.get(key)
+            return entry is not None and entry["expires_at_mono"] > time.monotonic()
+
     def get_option_quotes(self, option_symbols: Union[str, List[str]]) -> Dict[str, Any]:
         """Get quotes for specific option symbols"""
         if isinstance(option_symbols, list):
             option_symbols = ",".join(option_symbols)
 
-        logger.info(f"Fetching option quotes for {len(option_symbols.split(','))} symbols")
-        logger.debug(f"{option_symbols.split(',')}")
+        logger.info("Fetching option quotes for %d symbols", option_symbols.count(",") + 1)
+        logger.debug("%s", option_symbols)
         return self._request("GET", f"marketdata/quotes/{option_symbols}")
 
     def get_stream_quotes(self, symbols: Union[str, List[str]]) -> Dict[str, Any]:
@@ -1244,19 +1320,13 @@ class TradeStationClient:
 
         Example: SPY 260221C450 or SPY 260221P450.50
         """
-        exp_str = expiration.strftime("%y%m%d")
         option_root = resolve_option_root(underlying)
-
-        # Format strike with proper precision
-        if strike == int(strike):
-            strike_str = str(int(strike))
-        else:
-            strike_str = f"{strike:.2f}"
-
-        symbol = f"{option_root} {exp_str}{option_type.upper()}{strike_str}"
+        symbol = format_option_symbol(
+            option_root, expiration.strftime("%y%m%d"), option_type.upper(), strike
+        )
         if option_root != underlying:
-            logger.debug(f"Option root override: {underlying} -> {option_root}")
-        logger.debug(f"Built option symbol: {symbol}")
+            logger.debug("Option root override: %s -> %s", underlying, option_root)
+        logger.debug("Built option symbol: %s", symbol)
         return symbol
 
     def is_market_open(self, check_extended: bool = False) -> bool:
@@ -1279,15 +1349,15 @@ class TradeStationClient:
         current_time = now_et.time()
 
         if check_extended:
-            market_open = datetime.strptime("04:00:00", "%H:%M:%S").time()
-            market_close = datetime.strptime("20:00:00", "%H:%M:%S").time()
+            market_open = EXTENDED_OPEN
+            market_close = EXTENDED_CLOSE
         else:
-            market_open = datetime.strptime("09:30:00", "%H:%M:%S").time()
+            market_open = REGULAR_OPEN
             # Half-day early close: regular session ends at 13:00 ET.
             if now_et.date() in NYSE_HALF_DAYS:
-                market_close = datetime.strptime("13:00:00", "%H:%M:%S").time()
+                market_close = HALF_DAY_CLOSE
             else:
-                market_close = datetime.strptime("16:00:00", "%H:%M:%S").time()
+                market_close = REGULAR_CLOSE
 
         return market_open <= current_time <= market_close
 
@@ -1304,9 +1374,7 @@ class TradeStationClient:
         elif regular_open:
             session = "Regular Trading Hours"
         elif extended_open:
-            current_time = now_et.time()
-            pre_market_end = datetime.strptime("09:30:00", "%H:%M:%S").time()
-            if current_time < pre_market_end:
+            if now_et.time() < REGULAR_OPEN:
                 session = "Pre-Market"
             else:
                 session = "After-Hours"
@@ -44,7 +44,7 @@ import requests as _requests
 from src.ingestion.tradestation_client import TradeStationClient
 from src.database import db_connection, close_connection_pool
 from src.config import _getenv_int, _getenv_bool
-from src.utils import get_logger
+from src.utils import get_logger, json_loads
 from src.validation import (
     safe_float,
     safe_datetime,
@@ -355,7 +355,7 @@ class VolatilityIndexIngester:
                     continue
 
                 try:
-                    payload = json.loads(line)
+                    payload = json_loads(line)
                 except json.JSONDecodeError:
                     logger.warning(
                         "%s stream: JSON decode failed, skipping line: %s",
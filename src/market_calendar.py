@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import os
 from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Optional
 
 import pytz
@@ -33,6 +34,14 @@ logger = get_logger(__name__)
 # markets care about wall-clock time.
 ET = pytz.timezone("US/Eastern")
 
+# Session boundaries (ET wall clock). Built once here; the hours checks run
+# on every ingestion/engine cycle and used to strptime these per call.
+EXTENDED_OPEN = time(4, 0)
+REGULAR_OPEN = time(9, 30)
+HALF_DAY_CLOSE = time(13, 0)
+REGULAR_CLOSE = time(16, 0)
+EXTENDED_CLOSE = time(20, 0)
+
 
 # ---------------------------------------------------------------------------
 # NYSE holidays
@@ -156,6 +165,19 @@ def settlement_close_time_for_contract(
     return expiration_close_time_et(underlying_symbol, expiration)
 
 
+@lru_cache(maxsize=256)
+def _expiration_epoch(expiration_date: date, market_close_time: str) -> float:
+    """POSIX timestamp of ``market_close_time`` ET on ``expiration_date``.
+
+    A chain has a handful of distinct (expiration, close) pairs but every
+    contract re-prices its time to expiry, so the parse + localize is
+    cached rather than redone per quote.
+    """
+    close_t = datetime.strptime(market_close_time, "%H:%M:%S").time()
+    expiration_dt = ET.localize(datetime.combine(expiration_date, close_t))
+    return expiration_dt.timestamp()  # type: ignore[no-any-return]
+
+
 def calculate_time_to_expiration(
     current_date: datetime,
     expiration_date: date,
@@ -166,17 +188,13 @@ def calculate_time_to_expiration(
     The expiration date is anchored at the US equity market close in ET
     by default; pass ``market_close_time="09:30:00"`` for AM-settled
     contracts (or use ``expiration_close_time_et`` to derive it).  Naive
-    ``current_date`` values are treated as UTC and converted to ET.
+    ``current_date`` values are treated as UTC.
     """
     if current_date.tzinfo is None:
-        current_date = pytz.UTC.localize(current_date).astimezone(ET)
-    else:
-        current_date = current_date.astimezone(ET)
-
-    close_t = datetime.strptime(market_close_time, "%H:%M:%S").time()
-    expiration_dt = ET.localize(datetime.combine(expiration_date, close_t))
+        current_date = pytz.UTC.localize(current_date)
 
-    years = (expiration_dt - current_date).total_seconds() / 86_400 / 365.0
+    expiration_ts = _expiration_epoch(expiration_date, market_close_time)
+    years = (expiration_ts - current_date.timestamp()) / 86_400 / 365.0
     # Past the settlement instant the contract has EXPIRED. Return 0 so
     # callers' ``T <= 0`` guards (BS gamma/IV solver/Greeks) drop it. The
     # floor below intentionally only protects *still-alive* near-expiry
@@ -215,12 +233,8 @@ def is_market_hours(dt: Optional[datetime] = None, check_extended: bool = False)
 
     current_time = dt.time()
     if check_extended:
-        market_open = datetime.strptime("04:00:00", "%H:%M:%S").time()
-        market_close = datetime.strptime("20:00:00", "%H:%M:%S").time()
-    else:
-        market_open = datetime.strptime("09:30:00", "%H:%M:%S").time()
-        market_close = datetime.strptime("16:00:00", "%H:%M:%S").time()
-    return market_open <= current_time <= market_close
+        return EXTENDED_OPEN <= current_time <= EXTENDED_CLOSE
+    return REGULAR_OPEN <= current_time <= REGULAR_CLOSE
 
 
 def is_rth_settled(dt: Optional[datetime] = None, settle_minutes: int = 30) -> bool:
@@ -255,18 +269,13 @@ def get_market_session(dt: Optional[datetime] = None) -> str:
         return "closed"
 
     current_time = dt.time()
-    pre_market_start = datetime.strptime("04:00:00", "%H:%M:%S").time()
-    regular_open = datetime.strptime("09:30:00", "%H:%M:%S").time()
-    regular_close = datetime.strptime("16:00:00", "%H:%M:%S").time()
-    after_hours_end = datetime.strptime("20:00:00", "%H:%M:%S").time()
-
-    if current_time < pre_market_start:
+    if current_time < EXTENDED_OPEN:
         return "closed"
-    if current_time < regular_open:
+    if current_time < REGULAR_OPEN:
         return "pre-market"
-    if current_time < regular_close:
+    if current_time < REGULAR_CLOSE:
         return "regular"
-    if current_time < after_hours_end:
+    if current_time < EXTENDED_CLOSE:
         return "after-hours"
     return "closed"
 
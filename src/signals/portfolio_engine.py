@@ -19,7 +19,7 @@ import json
 import re
 from contextlib import contextmanager
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, datetime, time, timedelta, timezone
 from typing import Optional
 
 from src.config import (
@@ -98,10 +98,18 @@ from src.signals.scoring_engine import ScoreSnapshot
 from src.signals.strategy_builder import StrategyBuilder
 from src.symbols import get_canonical_symbol
 from src.utils import get_logger
+from src.market_calendar import REGULAR_CLOSE, REGULAR_OPEN
 from src.validation import ET, NYSE_HOLIDAYS
 
 logger = get_logger(__name__)
 
+# Time-of-day bucket starts for _classify_time_bucket (ET). The close bucket
+# ends at REGULAR_CLOSE and the open bucket starts at REGULAR_OPEN.
+_TOD_MORNING_START = time(10, 30)
+_TOD_LUNCH_START = time(11, 30)
+_TOD_AFTERNOON_START = time(13, 30)
+_TOD_CLOSE_START = time(15, 30)
+
 
 # ---------------------------------------------------------------------------
 # Dataclasses
@@ -226,10 +234,7 @@ class PortfolioEngine:
         if dt.weekday() > 4 or dt.date() in NYSE_HOLIDAYS:
             return "CLOSED"
 
-        current_time = dt.time()
-        market_open = datetime.strptime("09:30:00", "%H:%M:%S").time()
-        market_close = datetime.strptime("16:00:00", "%H:%M:%S").time()
-        return "OPEN" if market_open <= current_time < market_close else "CLOSED"
+        return "OPEN" if REGULAR_OPEN <= dt.time() < REGULAR_CLOSE else "CLOSED"
 
     @staticmethod
     def _risk_profile_for_timeframe(signal_timeframe: Optional[str]) -> dict:
@@ -2173,30 +2178,15 @@ class PortfolioEngine:
         else:
             ts_et = opened_at.astimezone(ET)
         t = ts_et.time()
-        if (
-            t >= datetime.strptime("15:30", "%H:%M").time()
-            and t < datetime.strptime("16:00", "%H:%M").time()
-        ):
+        if _TOD_CLOSE_START <= t < REGULAR_CLOSE:
             return "close"
-        if (
-            t >= datetime.strptime("13:30", "%H:%M").time()
-            and t < datetime.strptime("15:30", "%H:%M").time()
-        ):
+        if _TOD_AFTERNOON_START <= t < _TOD_CLOSE_START:
             return "afternoon"
-        if (
-            t >= datetime.strptime("11:30", "%H:%M").time()
-            and t < datetime.strptime("13:30", "%H:%M").time()
-        ):
+        if _TOD_LUNCH_START <= t < _TOD_AFTERNOON_START:
             return "lunch"
-        if (
-            t >= datetime.strptime("10:30", "%H:%M").time()
-            and t < datetime.strptime("11:30", "%H:%M").time()
-        ):
+        if _TOD_MORNING_START <= t < _TOD_LUNCH_START:
             return "morning"
-        if (
-            t >= datetime.strptime("09:30", "%H:%M").time()
-            and t < datetime.strptime("10:30", "%H:%M").time()
-        ):
+        if REGULAR_OPEN <= t < _TOD_MORNING_START:
             return "open"
         return "outside"
 
@@ -2712,12 +2702,12 @@ class PortfolioEngine:
 
         market_open_dt = datetime.combine(
             ts_et.date(),
-            datetime.strptime("09:30", "%H:%M").time(),
+            REGULAR_OPEN,
             tzinfo=ts_et.tzinfo,
         )
         market_close_dt = datetime.combine(
             ts_et.date(),
-            datetime.strptime("16:00", "%H:%M").time(),
+            REGULAR_CLOSE,
             tzinfo=ts_et.tzinfo,
         )
         morning_cutoff_dt = market_open_dt + timedelta(minutes=no_zero_morning)
@@ -27,6 +27,14 @@ Usage::
     python -m src.tools.underlying_backfill --symbols SPY,SPX,QQQ,NDX \
         --start 2026-05-01 --end 2026-07-23
 
+Rows are committed per request chunk, so an interrupted run keeps what it
+fetched; rerun with ``--resume`` to continue from each symbol's last stored
+day instead of the start of the window. Chunk commits run with
+``synchronous_commit = off``: a database crash may drop the last few chunks,
+which ``--resume`` simply refetches. ``--max-in-flight N`` keeps up to N
+chunk requests outstanding per symbol (default 1, a one-ahead prefetch) for
+when request latency rather than the quota bounds a long backfill.
+
 Verify against a live TradeStation session + database — the pure range/parse
 and alias-resolution logic is unit-tested (``tests/test_underlying_backfill.py``),
 but the HTTP and DB paths need real credentials to exercise.
@@ -38,8 +46,10 @@ import argparse
 import logging
 import os
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 
 from src.symbols import resolve_symbol
 from src.validation import safe_datetime, safe_float
@@ -50,9 +60,16 @@ logger = logging.getLogger(__name__)
 # the request window so even a 24h-session day (~1,440 1-min bars) stays well
 # under the cap: 25 days × 1,440 ≈ 36k. Tunable via --days-per-chunk.
 _DEFAULT_DAYS_PER_CHUNK = 25
-# Politeness pause between chunk requests so a long backfill doesn't hammer the
-# API or trip rate limits.
-_INTER_REQUEST_SECONDS = 0.3
+# Optional fixed pause between chunk requests. Off by default: every request
+# already goes through TradeStationClient's rate-limit governor (static 5-min
+# cap + X-RateLimit header gate), which only sleeps when the quota is actually
+# close, so a fixed pause just serialises an under-quota backfill. Kept as a
+# --sleep-seconds knob for operators who want extra headroom.
+_INTER_REQUEST_SECONDS = 0.0
+# Chunk requests kept outstanding ahead of the one being parsed/written. The
+# client's governor still paces them; raise with --max-in-flight when the
+# per-request latency, not the quota, is what bounds a long backfill.
+_DEFAULT_MAX_IN_FLIGHT = 1
 
 
 def _safe_bigint(value: Any) -> int:
@@ -128,10 +145,13 @@ def _bar_to_row(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     }
 
 
+# Rows per multi-row INSERT statement; a 25-day chunk is a few dozen pages.
+_UPSERT_PAGE_SIZE = 1000
+
 _UPSERT_SQL = """
     INSERT INTO underlying_quotes
     (symbol, timestamp, open, high, low, close, up_volume, down_volume)
-    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+    VALUES %s
     ON CONFLICT (symbol, timestamp) DO UPDATE SET
         open = COALESCE(underlying_quotes.open, EXCLUDED.open),
         high = GREATEST(underlying_quotes.high, EXCLUDED.high),
@@ -144,11 +164,20 @@ _UPSERT_SQL = """
 
 
 def upsert_bars(conn, symbol: str, rows: List[Dict[str, Any]]) -> int:
-    """Upsert parsed bars for ``symbol``; returns the number written."""
+    """Upsert parsed bars for ``symbol``; returns the number written.
+
+    Sent as multi-row ``INSERT ... VALUES`` pages via ``execute_values``
+    (psycopg2's ``executemany`` is one round-trip per row). ``rows`` must be
+    unique on timestamp — a single ``ON CONFLICT DO UPDATE`` statement cannot
+    touch the same row twice — which :func:`iter_symbol_chunks` guarantees.
+    """
     if not rows:
         return 0
+    from psycopg2.extras import execute_values
+
     cur = conn.cursor()
-    cur.executemany(
+    execute_values(
+        cur,
         _UPSERT_SQL,
         [
             (
@@ -163,10 +192,81 @@ def upsert_bars(conn, symbol: str, rows: List[Dict[str, Any]]) -> int:
             )
             for r in rows
         ],
+        page_size=_UPSERT_PAGE_SIZE,
     )
     return len(rows)
 
 
+def iter_symbol_chunks(
+    client,
+    symbol: str,
+    start: date,
+    end: date,
+    *,
+    days_per_chunk: int = _DEFAULT_DAYS_PER_CHUNK,
+    session_template: str = "Default",
+    sleep_seconds: float = _INTER_REQUEST_SECONDS,
+    max_in_flight: int = _DEFAULT_MAX_IN_FLIGHT,
+) -> Iterator[List[Dict[str, Any]]]:
+    """Yield the parsed, deduplicated rows of each request chunk in order.
+
+    See :func:`fetch_symbol` for the endpoint choice. Up to ``max_in_flight``
+    chunk requests are kept outstanding ahead of the one being parsed (1 =
+    plain one-ahead prefetch); results are still consumed strictly in range
+    order, so dedup and the per-chunk yields are unchanged. Yielding per
+    chunk lets :func:`backfill` persist as it goes instead of holding the
+    whole window.
+    """
+    ranges = _chunk_ranges(start, end, days_per_chunk)
+
+    def _get(first: str, last: str) -> Any:
+        return client.get_bars(
+            symbol,
+            interval=1,
+            unit="Minute",
+            firstdate=first,
+            lastdate=last,
+            sessiontemplate=session_template,
+            warn_if_closed=False,
+        )
+
+    if not ranges:
+        return
+    workers = max(1, max_in_flight)
+    seen: set = set()
+    total = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bar-prefetch") as ex:
+        pending: Deque[Future] = deque()
+        submitted = 0
+
+        def _top_up() -> None:
+            nonlocal submitted
+            while submitted < len(ranges) and len(pending) < workers:
+                if submitted and sleep_seconds:
+                    time.sleep(sleep_seconds)
+                pending.append(ex.submit(_get, *ranges[submitted]))
+                submitted += 1
+
+        _top_up()
+        for first, last in ranges:
+            payload = pending.popleft().result()
+            _top_up()
+            bars = (payload or {}).get("Bars") or []
+            rows: List[Dict[str, Any]] = []
+            for raw in bars:
+                row = _bar_to_row(raw)
+                if row is None:
+                    continue
+                key = row["timestamp"]
+                if key in seen:
+                    continue
+                seen.add(key)
+                rows.append(row)
+            total += len(rows)
+            logger.info("%s %s..%s → %d bars (running %d)", symbol, first, last, len(bars), total)
+            yield rows
+
+
 def fetch_symbol(
     client,
     symbol: str,
@@ -176,6 +276,7 @@ def fetch_symbol(
     days_per_chunk: int = _DEFAULT_DAYS_PER_CHUNK,
     session_template: str = "Default",
     sleep_seconds: float = _INTER_REQUEST_SECONDS,
+    max_in_flight: int = _DEFAULT_MAX_IN_FLIGHT,
 ) -> List[Dict[str, Any]]:
     """Fetch + parse all 1-minute bars for ``symbol`` across the window.
 
@@ -190,34 +291,46 @@ def fetch_symbol(
     boundaries never overlap, but a defensive dedup guards against the API
     returning an edge bar twice).
     """
-    seen: set = set()
     rows: List[Dict[str, Any]] = []
-    for first, last in _chunk_ranges(start, end, days_per_chunk):
-        payload = client.get_bars(
-            symbol,
-            interval=1,
-            unit="Minute",
-            firstdate=first,
-            lastdate=last,
-            sessiontemplate=session_template,
-            warn_if_closed=False,
-        )
-        bars = (payload or {}).get("Bars") or []
-        for raw in bars:
-            row = _bar_to_row(raw)
-            if row is None:
-                continue
-            key = row["timestamp"]
-            if key in seen:
-                continue
-            seen.add(key)
-            rows.append(row)
-        logger.info("%s %s..%s → %d bars (running %d)", symbol, first, last, len(bars), len(rows))
-        if sleep_seconds:
-            time.sleep(sleep_seconds)
+    for chunk in iter_symbol_chunks(
+        client,
+        symbol,
+        start,
+        end,
+        days_per_chunk=days_per_chunk,
+        session_template=session_template,
+        sleep_seconds=sleep_seconds,
+        max_in_flight=max_in_flight,
+    ):
+        rows.extend(chunk)
     return rows
 
 
+def resume_start(conn, symbol: str, start: date, end: date) -> date:
+    """First day still worth fetching for ``symbol`` in ``[start, end]``.
+
+    Returns the UTC date of the latest bar already in ``underlying_quotes``
+    for the window (that day is re-fetched, since it may be partial — the
+    upsert is idempotent), or ``start`` when nothing has been written yet.
+    """
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT MAX(timestamp) FROM underlying_quotes "
+        "WHERE symbol = %s AND timestamp >= %s AND timestamp < %s",
+        (
+            symbol,
+            datetime(start.year, start.month, start.day, tzinfo=timezone.utc),
+            datetime(end.year, end.month, end.day, tzinfo=timezone.utc) + timedelta(days=1),
+        ),
+    )
+    row = cur.fetchone()
+    last = row[0] if row else None
+    if last is None:
+        return start
+    last_day: date = last.astimezone(timezone.utc).date()
+    return max(start, min(last_day, end))
+
+
 def backfill(
     symbols: List[str],
     start: date,
@@ -226,8 +339,16 @@ def backfill(
     days_per_chunk: int = _DEFAULT_DAYS_PER_CHUNK,
     session_template: str = "Default",
     dry_run: bool = False,
+    sleep_seconds: float = _INTER_REQUEST_SECONDS,
+    resume: bool = False,
+    max_in_flight: int = _DEFAULT_MAX_IN_FLIGHT,
 ) -> Dict[str, int]:
-    """Backfill each symbol; returns ``{symbol: rows_written}``."""
+    """Backfill each symbol; returns ``{symbol: rows_written}``.
+
+    Rows are committed per request chunk. With ``resume`` each symbol starts
+    from the day of its latest bar already stored in the window (see
+    :func:`resume_start`) rather than from ``start``.
+    """
     from src.database import db_connection
     from src.ingestion.tradestation_client import TradeStationClient
 
@@ -256,25 +377,46 @@ def backfill(
                 ts_symbol,
                 symbol,
             )
-        rows = fetch_symbol(
+        fetch_start = start
+        if resume and not dry_run:
+            with db_connection() as conn:
+                fetch_start = resume_start(conn, symbol, start, end)
+            if fetch_start != start:
+                logger.info("%s: resuming from %s (already written up to it)", symbol, fetch_start)
+        chunks = iter_symbol_chunks(
             client,
             ts_symbol,
-            start,
+            fetch_start,
             end,
             days_per_chunk=days_per_chunk,
             session_template=session_template,
+            sleep_seconds=sleep_seconds,
+            max_in_flight=max_in_flight,
         )
         if dry_run:
+            parsed = sum(len(rows) for rows in chunks)
             logger.info(
                 "[dry-run] %s (%s): %d bars parsed, not written",
                 symbol,
                 ts_symbol,
-                len(rows),
+                parsed,
             )
             written[symbol] = 0
             continue
-        with db_connection() as conn:
-            written[symbol] = upsert_bars(conn, symbol, rows)
+        # Commit each chunk as it lands so a crash or Ctrl-C mid-run keeps
+        # everything fetched so far; --resume then picks up from there
+        # instead of re-spending rate-limit quota on the whole window.
+        written[symbol] = 0
+        for rows in chunks:
+            if not rows:
+                continue
+            with db_connection() as conn:
+                # Skip the WAL flush wait on each chunk commit: a crash can at
+                # worst lose the last few chunks, which the API still has and
+                # --resume refetches. Scoped to this transaction, so the
+                # pooled connection goes back with normal durability.
+                conn.cursor().execute("SET LOCAL synchronous_commit = off")
+                written[symbol] += upsert_bars(conn, symbol, rows)
         logger.info("%s: wrote %d bars to underlying_quotes", symbol, written[symbol])
     return written
 
@@ -287,6 +429,23 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--days-per-chunk", type=int, default=_DEFAULT_DAYS_PER_CHUNK)
     parser.add_argument("--session-template", default="Default")
     parser.add_argument("--dry-run", action="store_true", help="Fetch + parse but do not write")
+    parser.add_argument(
+        "--sleep-seconds",
+        type=float,
+        default=_INTER_REQUEST_SECONDS,
+        help="Fixed pause between chunk requests (default: none; the client rate-limits)",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=_DEFAULT_MAX_IN_FLIGHT,
+        help="Chunk requests kept outstanding per symbol (default: 1, one-ahead prefetch)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip days already written for each symbol (restart after a crash)",
+    )
     args = parser.parse_args(argv)
 
     logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
@@ -312,6 +471,9 @@ def main(argv: Optional[List[str]] = None) -> int:
         days_per_chunk=args.days_per_chunk,
         session_template=args.session_template,
         dry_run=args.dry_run,
+        sleep_seconds=args.sleep_seconds,
+        max_in_flight=args.max_in_flight,
+        resume=args.resume,
     )
     total = sum(result.values())
     logger.info("Backfill complete: %s (total %d bars)", result, total)
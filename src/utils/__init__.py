@@ -4,6 +4,7 @@ Utility modules for ZeroGEX platform
 Components:
 - Logging configuration with environment-based levels
 - Common utility functions
+- JSON decoding (orjson when installed, stdlib otherwise)
 
 Usage:
     from src.utils import get_logger, set_log_level
@@ -22,9 +23,12 @@ from src.utils.logging import (
     request_id_var,
     set_log_level,
 )
+from src.utils.jsonio import HAS_FAST_JSON, json_loads
 
 __all__ = [
+    "HAS_FAST_JSON",
     "get_logger",
+    "json_loads",
     "logger",
     "new_request_id",
     "request_id_var",
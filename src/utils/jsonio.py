@@ -0,0 +1,25 @@
+"""
+JSON decoding for the ingestion hot paths
+
+Uses orjson when it is installed (``pip install zerogex-oa[fastjson]``) and
+falls back to the stdlib otherwise, so the dependency stays optional. Both
+decoders accept ``str`` or ``bytes`` and raise a ``json.JSONDecodeError``
+subclass on bad input, so callers keep catching ``json.JSONDecodeError``.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - optional dependency
+    _orjson = None  # type: ignore[assignment]
+
+HAS_FAST_JSON = _orjson is not None
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document from ``str`` or ``bytes``."""
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
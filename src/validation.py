@@ -132,7 +132,12 @@ def safe_datetime(
 
     try:
         # Parse UTC timestamp
-        if value.endswith("Z"):
+        if len(value) == 20 and value[10] == "T" and value[19] == "Z":
+            # Fast path for TradeStation's fixed 'YYYY-MM-DDTHH:MM:SSZ' shape:
+            # fromisoformat is a C parser, strptime re-interprets the format
+            # string on every call and dominates bar/quote parsing loops.
+            dt_utc = datetime.fromisoformat(value[:19]).replace(tzinfo=pytz.UTC)
+        elif value.endswith("Z"):
             dt_utc = datetime.strptime(value, "%Y-%m-%dT%H:%M:%SZ")
             dt_utc = pytz.UTC.localize(dt_utc)
         else:
@@ -185,6 +190,10 @@ def validate_quote_data(quote: dict) -> bool:
     return True
 
 
+_BAR_REQUIRED_FIELDS = ("TimeStamp", "Open", "High", "Low", "Close")
+_BAR_REQUIRED_FIELD_SET = frozenset(_BAR_REQUIRED_FIELDS)
+
+
 def validate_bar_data(bar: dict) -> bool:
     """
     Validate bar data has required fields and OHLC consistency
@@ -195,19 +204,18 @@ def validate_bar_data(bar: dict) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ["TimeStamp", "Open", "High", "Low", "Close"]
-
-    # Check required fields
-    for field in required_fields:
-        if field not in bar:
-            logger.warning(f"Bar missing required field: {field}")
-            return False
+    # Check required fields: one C-level subset test in the common case; the
+    # per-field walk only runs to name the missing field.
+    if not _BAR_REQUIRED_FIELD_SET <= bar.keys():
+        missing = next(f for f in _BAR_REQUIRED_FIELDS if f not in bar)
+        logger.warning("Bar missing required field: %s", missing)
+        return False
 
     # Validate OHLC relationship: High >= Open, Close, Low
-    open_price = safe_float(bar.get("Open"), field_name="Open")
-    high_price = safe_float(bar.get("High"), field_name="High")
-    low_price = safe_float(bar.get("Low"), field_name="Low")
-    close_price = safe_float(bar.get("Close"), field_name="Close")
+    open_price = safe_float(bar["Open"], field_name="Open")
+    high_price = safe_float(bar["High"], field_name="High")
+    low_price = safe_float(bar["Low"], field_name="Low")
+    close_price = safe_float(bar["Close"], field_name="Close")
 
     if not (low_price <= open_price <= high_price and low_price <= close_price <= high_price):
         logger.warning(
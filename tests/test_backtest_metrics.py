@@ -19,6 +19,7 @@ from src.backtesting.engine import (
     _regime_tags,
     _streaks,
     _summarize,
+    _weekdays_between,
 )
 from src.backtesting.models import EquityPoint, TradeResult
 from src.signals.playbook.backtest import CardRow
@@ -117,6 +118,17 @@ def test_exposure_pct_merges_overlaps():
     assert exp == round(60 / 390 * 100, 1)
 
 
+def test_weekdays_between_matches_day_walk():
+    lo = date(2026, 1, 1)
+    for span in range(0, 40):
+        for offset in range(7):
+            a = lo + timedelta(days=offset)
+            b = a + timedelta(days=span)
+            walked = sum(1 for i in range(span + 1) if (a + timedelta(days=i)).weekday() < 5)
+            assert _weekdays_between(a, b) == walked
+    assert _weekdays_between(date(2026, 5, 2), date(2026, 5, 1)) == 0
+
+
 # ----------------------------------------------------------------------
 # Summary integration
 # ----------------------------------------------------------------------
@@ -0,0 +1,102 @@
+"""Unit tests for the DB password provider plugins.
+
+Covers the ``.pgpass`` provider's existence/permission check, which runs on
+every pool initialisation, so a regression there blocks the whole platform
+from connecting.
+"""
+
+import os
+
+import pytest
+
+from src.database import password_providers as pp
+
+
+def _write_pgpass(tmp_path, mode):
+    p = tmp_path / ".pgpass"
+    p.write_text("h:5432:db:u:pw\n")
+    os.chmod(p, mode)
+    return p
+
+
+def test_pgpass_with_0600_is_accepted(tmp_path, monkeypatch):
+    monkeypatch.setattr(pp, "_PGPASS_PATH", _write_pgpass(tmp_path, 0o600))
+    assert pp._get_password_from_pgpass() is None
+
+
+def test_pgpass_missing_raises(tmp_path, monkeypatch):
+    monkeypatch.setattr(pp, "_PGPASS_PATH", tmp_path / ".pgpass")
+    with pytest.raises(ValueError, match="not found"):
+        pp._get_password_from_pgpass()
+
+
+def test_pgpass_wrong_permissions_reports_octal_mode(tmp_path, monkeypatch):
+    monkeypatch.setattr(pp, "_PGPASS_PATH", _write_pgpass(tmp_path, 0o644))
+    with pytest.raises(ValueError, match="incorrect permissions: 644"):
+        pp._get_password_from_pgpass()
+
+
+def test_pgpass_path_honors_pgpassfile(tmp_path, monkeypatch):
+    import importlib
+
+    target = tmp_path / "custom_pgpass"
+    monkeypatch.setenv("PGPASSFILE", str(target))
+    try:
+        reloaded = importlib.reload(pp)
+        assert reloaded._PGPASS_PATH == target
+    finally:
+        monkeypatch.delenv("PGPASSFILE")
+        importlib.reload(pp)
+
+
+@pytest.fixture
+def reload_with_provider(monkeypatch):
+    """Re-import the module with DB_PASSWORD_PROVIDER set, restoring after."""
+    import importlib
+
+    def _reload(provider):
+        monkeypatch.setenv("DB_PASSWORD_PROVIDER", provider)
+        return importlib.reload(pp)
+
+    yield _reload
+    monkeypatch.delenv("DB_PASSWORD_PROVIDER", raising=False)
+    importlib.reload(pp)
+
+
+def test_get_db_password_dispatches_env_provider(reload_with_provider, monkeypatch):
+    monkeypatch.setenv("DB_PASSWORD", "s3cret")
+    assert reload_with_provider("env").get_db_password() == "s3cret"
+
+
+def test_unknown_provider_imports_but_raises_on_use(reload_with_provider):
+    mod = reload_with_provider("vault")
+    with pytest.raises(ValueError, match="Unknown password provider: vault"):
+        mod.get_db_password()
+
+
+def test_pgpassfile_is_read_by_provider_and_credential_lookup(tmp_path, monkeypatch):
+    import importlib
+
+    target = tmp_path / "custom_pgpass"
+    target.write_text("dbhost:5432:zdb:zuser:from-pgpassfile\n")
+    os.chmod(target, 0o600)
+    monkeypatch.setenv("PGPASSFILE", str(target))
+    for var in ("DB_HOST", "DB_PORT", "DB_NAME", "DB_USER", "DB_PASSWORD"):
+        monkeypatch.delenv(var, raising=False)
+    try:
+        mod = importlib.reload(pp)
+        assert mod._get_password_from_pgpass() is None
+        assert mod.find_pgpass_entry()["password"] == "from-pgpassfile"
+        assert mod.resolve_db_credentials()["password"] == "from-pgpassfile"
+    finally:
+        monkeypatch.delenv("PGPASSFILE")
+        importlib.reload(pp)
+
+
+def test_pgpass_missing_hints_name_the_configured_file(tmp_path, monkeypatch):
+    missing = tmp_path / "custom_pgpass"
+    monkeypatch.setattr(pp, "_PGPASS_PATH", missing)
+    with pytest.raises(ValueError) as exc:
+        pp._get_password_from_pgpass()
+    assert f"nano {missing}" in str(exc.value)
+    assert f"chmod 600 {missing}" in str(exc.value)
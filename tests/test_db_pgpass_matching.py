@@ -10,6 +10,7 @@ those vars are unset.
 
 import pytest
 
+from src.database import password_providers
 from src.database.password_providers import find_pgpass_entry, resolve_db_credentials
 
 
@@ -97,7 +98,7 @@ def clean_db_env(monkeypatch):
 
 
 def test_resolve_picks_matching_env_target_password(clean_db_env, tmp_path, monkeypatch):
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(password_providers, "_PGPASS_PATH", tmp_path / ".pgpass")
     _write_pgpass(
         tmp_path,
         "localhost:5432:zerogex:postgres:local_pw",
@@ -112,7 +113,7 @@ def test_resolve_picks_matching_env_target_password(clean_db_env, tmp_path, monk
 
 
 def test_resolve_unconstrained_uses_first_line(clean_db_env, tmp_path, monkeypatch):
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(password_providers, "_PGPASS_PATH", tmp_path / ".pgpass")
     _write_pgpass(tmp_path, "rds.example:5432:zerogex:u:pw1")
     creds = resolve_db_credentials()
     assert creds["host"] == "rds.example"  # env unset → pgpass host adopted (legacy)
@@ -120,7 +121,7 @@ def test_resolve_unconstrained_uses_first_line(clean_db_env, tmp_path, monkeypat
 
 
 def test_resolve_wildcard_host_resolves_to_env(clean_db_env, tmp_path, monkeypatch):
-    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(password_providers, "_PGPASS_PATH", tmp_path / ".pgpass")
     _write_pgpass(tmp_path, "*:*:*:*:wild_pw")
     monkeypatch.setenv("DB_HOST", "real.host")
     creds = resolve_db_credentials()
@@ -129,7 +130,8 @@ def test_resolve_wildcard_host_resolves_to_env(clean_db_env, tmp_path, monkeypat
 
 
 def test_resolve_no_pgpass_falls_back_to_db_password(clean_db_env, tmp_path, monkeypatch):
-    monkeypatch.setenv("HOME", str(tmp_path))  # no .pgpass written here
+    # No .pgpass written here.
+    monkeypatch.setattr(password_providers, "_PGPASS_PATH", tmp_path / ".pgpass")
     monkeypatch.setenv("DB_HOST", "h")
     monkeypatch.setenv("DB_PASSWORD", "envpw")
     creds = resolve_db_credentials()
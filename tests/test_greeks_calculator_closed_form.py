@@ -0,0 +1,65 @@
+"""First-order Greeks in GreeksCalculator against scipy reference forms.
+
+The per-quote Greeks use an erf-based normal CDF and an inline pdf instead of
+``scipy.stats.norm``; these checks pin gamma / theta / vega to the textbook
+BSM expressions evaluated with scipy so the fast path cannot drift.
+"""
+
+import math
+
+import pytest
+from scipy.stats import norm
+
+from src.ingestion.greeks_calculator import GreeksCalculator
+
+R = 0.05
+Q = 0.013
+
+
+def _calc() -> GreeksCalculator:
+    return GreeksCalculator.__new__(GreeksCalculator)
+
+
+def _d1_d2(S, K, T, sigma):
+    d1 = (math.log(S / K) + (R - Q + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
+    return d1, d1 - sigma * math.sqrt(T)
+
+
+CASES = [
+    (450.0, 455.0, 30 / 365, 0.18),
+    (450.0, 400.0, 2 / 365, 0.35),
+    (5800.0, 5900.0, 0.5 / 365, 0.12),
+]
+
+
+@pytest.mark.parametrize("S,K,T,sigma", CASES)
+def test_gamma_and_vega_match_scipy(S, K, T, sigma):
+    d1, _ = _d1_d2(S, K, T, sigma)
+    ref_gamma = math.exp(-Q * T) * norm.pdf(d1) / (S * sigma * math.sqrt(T))
+    ref_vega = S * math.exp(-Q * T) * norm.pdf(d1) * math.sqrt(T) / 100.0
+
+    assert _calc().calculate_gamma(S, K, T, R, sigma, Q) == pytest.approx(ref_gamma, rel=1e-12)
+    assert _calc().calculate_vega(S, K, T, R, sigma, Q) == pytest.approx(ref_vega, rel=1e-12)
+
+
+@pytest.mark.parametrize("S,K,T,sigma", CASES)
+@pytest.mark.parametrize("option_type", ["C", "P"])
+def test_theta_matches_scipy(S, K, T, sigma, option_type):
+    d1, d2 = _d1_d2(S, K, T, sigma)
+    sign = 1.0 if option_type == "C" else -1.0
+    ref = (
+        -S * math.exp(-Q * T) * norm.pdf(d1) * sigma / (2 * math.sqrt(T))
+        - sign * R * K * math.exp(-R * T) * norm.cdf(sign * d2)
+        + sign * Q * S * math.exp(-Q * T) * norm.cdf(sign * d1)
+    ) / 365.0
+
+    got = _calc().calculate_theta(S, K, T, R, sigma, option_type, Q)
+    assert got == pytest.approx(ref, rel=1e-10, abs=1e-12)
+
+
+def test_degenerate_inputs_are_zero():
+    calc = _calc()
+    assert calc.calculate_gamma(450.0, 455.0, 0.0, R, 0.2) == 0.0
+    assert calc.calculate_theta(450.0, 455.0, 0.1, R, 0.0, "C") == 0.0
+    assert calc.calculate_vega(0.0, 455.0, 0.1, R, 0.2) == 0.0
+    assert calc.calculate_gamma(450.0, 0.0, 0.1, R, 0.2) == 0.0
@@ -0,0 +1,97 @@
+"""REST seed of OptionStreamAccumulator.
+
+``_seed_from_rest`` splits the tracked symbols into ``OPTION_BATCH_SIZE``
+quote batches. With ``OPTION_SEED_MAX_WORKERS`` > 1 the batches are fetched
+concurrently; either way every returned quote must be merged, and one failing
+batch must not take the rest of the seed down with it.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from src.ingestion import stream_manager
+from src.ingestion.stream_manager import OptionStreamAccumulator
+
+
+class _FakeClient:
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.fail_on = fail_on
+        self._lock = threading.Lock()
+
+    def get_option_quotes(self, batch):
+        with self._lock:
+            self.calls.append(list(batch))
+        if self.fail_on is not None and self.fail_on in batch:
+            raise RuntimeError("boom")
+        return {"Quotes": [{"Symbol": s, "Last": 1.0} for s in batch]}
+
+
+def _accumulator(client, symbols) -> OptionStreamAccumulator:
+    acc = OptionStreamAccumulator.__new__(OptionStreamAccumulator)
+    acc._client = client
+    acc._symbols = list(symbols)
+    acc._state = {}
+    acc._lock = threading.Lock()
+    acc._dirty = set()
+    acc._updates_received = 0
+    acc._wakeup = None
+    return acc
+
+
+@pytest.mark.parametrize("workers", [1, 4])
+def test_seed_merges_every_batch(monkeypatch, workers):
+    monkeypatch.setattr(stream_manager, "OPTION_BATCH_SIZE", 3)
+    monkeypatch.setattr(stream_manager, "OPTION_SEED_MAX_WORKERS", workers)
+    monkeypatch.setattr(stream_manager, "DELAY_BETWEEN_BATCHES", 0)
+    symbols = [f"SPY 260619C{600 + i}" for i in range(10)]
+    client = _FakeClient()
+    acc = _accumulator(client, symbols)
+
+    acc._seed_from_rest()
+
+    assert len(client.calls) == 4
+    assert set(acc._state) == set(symbols)
+    assert acc._dirty == set(symbols)
+
+
+def test_seed_tolerates_a_failed_batch(monkeypatch):
+    monkeypatch.setattr(stream_manager, "OPTION_BATCH_SIZE", 2)
+    monkeypatch.setattr(stream_manager, "OPTION_SEED_MAX_WORKERS", 4)
+    symbols = ["A", "B", "C", "D", "E"]
+    acc = _accumulator(_FakeClient(fail_on="C"), symbols)
+
+    acc._seed_from_rest()
+
+    assert set(acc._state) == {"A", "B", "E"}
+
+
+def test_serial_seed_sleeps_only_the_remaining_slack(monkeypatch):
+    monkeypatch.setattr(stream_manager, "OPTION_BATCH_SIZE", 1)
+    monkeypatch.setattr(stream_manager, "OPTION_SEED_MAX_WORKERS", 1)
+    monkeypatch.setattr(stream_manager, "DELAY_BETWEEN_BATCHES", 0.5)
+    clock = [100.0]
+    sleeps = []
+
+    def _sleep(seconds):
+        sleeps.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(stream_manager.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(stream_manager.time, "sleep", _sleep)
+
+    class _SlowClient(_FakeClient):
+        def get_option_quotes(self, batch):
+            clock[0] += 0.2 if batch == ["A"] else 0.7
+            return super().get_option_quotes(batch)
+
+    acc = _accumulator(_SlowClient(), ["A", "B", "C"])
+    acc._seed_from_rest()
+
+    # A took 0.2s -> wait the remaining 0.3s; B took 0.7s -> C starts at
+    # once; no trailing sleep after the last batch.
+    assert sleeps == [pytest.approx(0.3)]
+    assert set(acc._state) == {"A", "B", "C"}
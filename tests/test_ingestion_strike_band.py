@@ -0,0 +1,146 @@
+"""Strike band selection in StreamManager._get_strikes_near_price.
+
+The client hands back an ascending strike ladder; the band around spot is
+sliced with ``bisect`` and, past ``strike_count_max``, trimmed from the
+furthest-from-spot strikes inward. The result must stay ascending.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import date
+from unittest.mock import MagicMock
+
+from src.ingestion import stream_manager
+from src.ingestion.stream_manager import StreamManager
+
+_EXP = date(2026, 6, 19)
+
+
+def _manager(strikes, pct=5.0, count_max=100) -> StreamManager:
+    mgr = StreamManager.__new__(StreamManager)
+    mgr.client = MagicMock()
+    mgr.client.get_option_strikes.return_value = list(strikes)
+    mgr.client.has_cached_strikes.return_value = False
+    mgr.underlying = "SPY"
+    mgr._expiration_underlying = {}
+    mgr.strike_pct_range = pct
+    mgr.strike_count_max = count_max
+    mgr._traceback_logged = set()
+    mgr._exp_str_cache = {}
+    return mgr
+
+
+def test_band_is_inclusive_slice_of_ladder():
+    ladder = [float(s) for s in range(90, 111)]
+    mgr = _manager(ladder, pct=5.0)
+    assert mgr._get_strikes_near_price(_EXP, 100.0) == [float(s) for s in range(95, 106)]
+
+
+def test_band_trims_furthest_and_stays_sorted():
+    ladder = [float(s) for s in range(90, 111)]
+    mgr = _manager(ladder, pct=10.0, count_max=4)
+    assert mgr._get_strikes_near_price(_EXP, 100.2) == [99.0, 100.0, 101.0, 102.0]
+
+
+def test_band_outside_ladder_is_empty():
+    mgr = _manager([100.0, 105.0], pct=1.0)
+    assert mgr._get_strikes_near_price(_EXP, 200.0) == []
+
+
+def test_recalibrate_reports_change_only_when_ladder_moves():
+    ladder = [float(s) for s in range(90, 111)]
+    mgr = _manager(ladder, pct=2.0)
+    mgr.target_expirations = [_EXP]
+    mgr.tracked_option_symbols = []
+    mgr.current_price = 100.0
+
+    assert mgr._recalibrate_strikes(100.4) is True
+    first = list(mgr.tracked_option_symbols)
+    # Sub-strike drift keeps the same ±2% band -> same symbols, no restart.
+    assert mgr._recalibrate_strikes(100.5) is False
+    assert mgr.tracked_option_symbols == first
+    assert mgr.current_price == 100.5
+    # A multi-strike move shifts the band.
+    assert mgr._recalibrate_strikes(105.0) is True
+
+
+def test_strike_fetch_errors_log_traceback_once_per_type(caplog):
+    mgr = _manager([100.0])
+    mgr.client.get_option_strikes.side_effect = RuntimeError("upstream 503")
+
+    with caplog.at_level("ERROR", logger="src.ingestion.stream_manager"):
+        for _ in range(3):
+            assert mgr._get_strikes_near_price(_EXP, 100.0) == []
+
+    errors = [r for r in caplog.records if "Error fetching strikes" in r.getMessage()]
+    assert len(errors) == 3
+    assert [r.exc_info is not None for r in errors] == [True, False, False]
+
+
+def test_expiration_strings_are_cached_per_date():
+    mgr = _manager([])
+    first = mgr._expiration_strs(_EXP)
+    assert first == ("06-19-2026", "260619")
+    assert mgr._expiration_strs(_EXP) is first
+
+
+def test_build_option_symbols_skips_duplicate_contracts():
+    mgr = _manager([100.0, 100.0, 101.0], pct=5.0)
+    mgr.target_expirations = [_EXP]
+    # Two chain entries resolving to the same root must not double-subscribe.
+    mgr._expiration_underlying = {_EXP: ["SPY", "SPY"]}
+    mgr.current_price = 100.0
+
+    syms = mgr._build_option_symbols()
+
+    assert syms == ["SPY 260619C100", "SPY 260619P100", "SPY 260619C101", "SPY 260619P101"]
+    assert set(mgr._symbol_metadata) == set(syms)
+
+
+def test_strike_bands_fetched_per_chain_concurrently(monkeypatch):
+    monkeypatch.setattr(stream_manager, "OPTION_SEED_MAX_WORKERS", 4)
+    exp2 = date(2026, 6, 26)
+    mgr = _manager([99.0, 100.0, 101.0], pct=5.0)
+    mgr.client.get_option_strikes.side_effect = lambda sym, expiration=None: (
+        [100.0] if sym == "SPX" else [99.0, 100.0, 101.0]
+    )
+    pairs = [(_EXP, "SPXW"), (_EXP, "SPX"), (exp2, "SPXW")]
+
+    bands = mgr._fetch_strike_bands(pairs, 100.0)
+
+    assert list(bands) == pairs
+    assert bands[(_EXP, "SPX")] == [100.0]
+    assert bands[(exp2, "SPXW")] == [99.0, 100.0, 101.0]
+    assert mgr.client.get_option_strikes.call_count == 3
+
+
+def test_warm_strike_cache_rebuild_creates_no_executor(monkeypatch):
+    monkeypatch.setattr(stream_manager, "OPTION_SEED_MAX_WORKERS", 4)
+    created = []
+    monkeypatch.setattr(stream_manager, "ThreadPoolExecutor", lambda *a, **k: created.append(k))
+    mgr = _manager([99.0, 100.0, 101.0], pct=5.0)
+    mgr.client.has_cached_strikes.return_value = True
+    pairs = [(_EXP, "SPXW"), (_EXP, "SPX"), (date(2026, 6, 26), "SPXW")]
+
+    bands = mgr._fetch_strike_bands(pairs, 100.0)
+
+    assert created == []
+    assert list(bands) == pairs
+    assert mgr.client.get_option_strikes.call_count == 3
+
+
+def test_client_reports_cached_strikes(monkeypatch):
+    from src.ingestion import tradestation_client
+    from src.ingestion.tradestation_client import TradeStationClient
+
+    monkeypatch.setattr(tradestation_client, "TS_STRIKES_CACHE_TTL", 60)
+    client = TradeStationClient.__new__(TradeStationClient)
+    client._strikes_cache = {}
+    client._strikes_cache_lock = threading.Lock()
+    client._request = MagicMock(return_value={"Strikes": [["101"], ["100"]]})
+
+    assert not client.has_cached_strikes("SPY", "06-19-2026")
+    client.get_option_strikes("SPY", expiration="06-19-2026")
+    assert client.has_cached_strikes("SPY", "06-19-2026")
+    assert not client.has_cached_strikes("SPY", "06-26-2026")
@@ -0,0 +1,53 @@
+"""IV solver pricing kernel against scipy reference forms.
+
+The Newton loop prices and takes vega with the erf-based ``norm_cdf`` and an
+inline pdf instead of ``scipy.stats.norm``; these checks pin both to the
+textbook BSM expressions evaluated with scipy so the fast path cannot drift.
+"""
+
+import math
+
+import pytest
+from scipy.stats import norm
+
+from src.ingestion.iv_calculator import IVCalculator
+
+R = 0.05
+Q = 0.013
+
+CASES = [
+    (450.0, 455.0, 30 / 365, 0.18),
+    (450.0, 400.0, 2 / 365, 0.35),
+    (5800.0, 5900.0, 0.5 / 365, 0.12),
+]
+
+
+def _solver() -> IVCalculator:
+    return IVCalculator.__new__(IVCalculator)
+
+
+def _d1_d2(S, K, T, sigma):
+    d1 = (math.log(S / K) + (R - Q + 0.5 * sigma**2) * T) / (sigma * math.sqrt(T))
+    return d1, d1 - sigma * math.sqrt(T)
+
+
+@pytest.mark.parametrize("S,K,T,sigma", CASES)
+@pytest.mark.parametrize("option_type", ["C", "P"])
+def test_price_matches_scipy(S, K, T, sigma, option_type):
+    d1, d2 = _d1_d2(S, K, T, sigma)
+    disc_q, disc_r = math.exp(-Q * T), math.exp(-R * T)
+    if option_type == "C":
+        ref = S * disc_q * norm.cdf(d1) - K * disc_r * norm.cdf(d2)
+    else:
+        ref = K * disc_r * norm.cdf(-d2) - S * disc_q * norm.cdf(-d1)
+
+    got = _solver()._black_scholes_price(S, K, T, R, sigma, option_type, Q)
+    assert got == pytest.approx(ref, rel=1e-10, abs=1e-10)
+
+
+@pytest.mark.parametrize("S,K,T,sigma", CASES)
+def test_vega_matches_scipy(S, K, T, sigma):
+    d1, _ = _d1_d2(S, K, T, sigma)
+    ref = S * math.exp(-Q * T) * norm.pdf(d1) * math.sqrt(T)
+
+    assert _solver()._vega(S, K, T, R, sigma, Q) == pytest.approx(ref, rel=1e-12)
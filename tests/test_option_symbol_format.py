@@ -0,0 +1,28 @@
+"""format_option_symbol must produce exactly what build_option_symbol does.
+
+StreamManager builds its whole option ladder through the pure formatter with
+the root/expiration resolved once per chain, so any drift from the client's
+per-contract builder would silently change the tracked symbols.
+"""
+
+from datetime import date
+
+import pytest
+
+from src.ingestion.tradestation_client import TradeStationClient, format_option_symbol
+from src.symbols import resolve_option_root
+
+
+@pytest.mark.parametrize("underlying", ["SPY", "$SPX.X", "$SPXW.X"])
+@pytest.mark.parametrize("strike", [450.0, 450.5, 5825.0, 17.25])
+@pytest.mark.parametrize("opt_type", ["C", "P"])
+def test_formatter_matches_client_builder(underlying, strike, opt_type):
+    exp = date(2026, 6, 19)
+    client = TradeStationClient.__new__(TradeStationClient)
+    expected = client.build_option_symbol(underlying, exp, opt_type, strike)
+    got = format_option_symbol(resolve_option_root(underlying), "260619", opt_type, strike)
+    assert got == expected
+
+
+def test_decimal_strike_keeps_two_places():
+    assert format_option_symbol("SPY", "260221", "P", 450.5) == "SPY 260221P450.50"
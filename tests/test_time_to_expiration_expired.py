@@ -47,3 +47,14 @@ def test_future_contract_unaffected():
     t = calculate_time_to_expiration(now, exp, market_close_time="16:00:00")
     # ~34 days out -> well above the floor.
     assert t > 0.08
+
+
+def test_naive_input_is_utc_and_matches_aware():
+    exp = date(2026, 11, 6)
+    # Crosses the 2026-11-01 DST change: the expiry instant is 16:00 EST.
+    aware = ET.localize(datetime(2026, 10, 30, 10, 0))
+    naive_utc = aware.astimezone(pytz.UTC).replace(tzinfo=None)
+    expected = (ET.localize(datetime(2026, 11, 6, 16, 0)) - aware).total_seconds() / 86_400 / 365.0
+    t = calculate_time_to_expiration(aware, exp)
+    assert abs(t - expected) < 1e-12
+    assert calculate_time_to_expiration(naive_utc, exp) == t
@@ -6,12 +6,19 @@
   when API_RETRY_ATTEMPTS<=1 (the data-retry budget must not gate auth).
 """
 
+import json
+
+import pytest
+
+from src.ingestion import tradestation_client as tc
 from src.ingestion.tradestation_client import TradeStationClient
 
 
 class _Resp:
-    def __init__(self, status_code, content=b"{}", payload=None):
+    def __init__(self, status_code, content=None, payload=None):
         self.status_code = status_code
+        if content is None:
+            content = json.dumps(payload if payload is not None else {}).encode()
         self.content = content
         self.text = content.decode() if isinstance(content, bytes) else str(content)
         self._payload = payload if payload is not None else {}
@@ -84,3 +91,82 @@ def test_401_twice_raises_after_single_refresh():
     # looping forever.
     assert c.auth.refreshes == 1
     assert raised
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    def request(self, **kw):
+        self.calls.append(kw)
+        return _Resp(200, payload={"ok": True})
+
+
+def test_rest_requests_reuse_the_client_session():
+    """REST calls go through the client's keep-alive Session, not a fresh
+    module-level requests.request() connection per call."""
+    c = _client()
+    c._http = _FakeSession()
+    c._gate_for_resource = lambda endpoint: None
+    c._gate_for_rate_limit = lambda: None
+    c._record_api_https_session_open = lambda: None
+    for _ in range(2):
+        c._build_request_response("GET", f"{c.base_url}/marketdata/quotes/SPY", {}, None, None)
+    assert [k["url"] for k in c._http.calls] == [f"{c.base_url}/marketdata/quotes/SPY"] * 2
+
+
+def test_http_pool_covers_concurrent_seed_workers(monkeypatch):
+    """The HTTPS pool must hold one idle connection per seed worker, or
+    urllib3 discards the surplus and the next batch re-handshakes."""
+    from src.ingestion import tradestation_client as tc
+
+    monkeypatch.setattr(tc, "OPTION_SEED_MAX_WORKERS", 16)
+    adapter = tc._new_http_session().get_adapter("https://api.tradestation.com/v3")
+    assert adapter._pool_maxsize >= 16
+
+
+def test_option_expirations_parse_date_prefix_and_sort():
+    from datetime import date
+
+    c = _client()
+    c._request = lambda *a, **k: {
+        "Expirations": [{"Date": "2026-06-19T00:00:00Z"}, {"Date": "2026-06-12T00:00:00Z"}]
+    }
+    assert c.get_option_expirations("SPY") == [date(2026, 6, 12), date(2026, 6, 19)]
+
+
+def test_fast_json_path_decodes_raw_content(monkeypatch):
+    monkeypatch.setattr(tc, "HAS_FAST_JSON", True)
+    c = _client()
+    resp = _Resp(200, content=b'{"Quotes": [{"Symbol": "SPY"}]}', payload={"wrong": True})
+    c._build_request_response = lambda *a, **k: resp
+    # The body comes from .content, not the double's .json().
+    assert c._request("GET", "marketdata/quotes/SPY") == {"Quotes": [{"Symbol": "SPY"}]}
+
+
+def test_fast_json_path_raises_json_decode_error_on_bad_body(monkeypatch):
+    monkeypatch.setattr(tc, "HAS_FAST_JSON", True)
+    with pytest.raises(json.JSONDecodeError):
+        tc._decode_response_json(_Resp(200, content=b'{"Quotes": ['))
+
+
+def test_malformed_stream_line_is_caught_as_json_decode_error(monkeypatch):
+    """json_loads (orjson when installed) must raise a json.JSONDecodeError
+    subclass so the snapshot reader's handler closes the stream and retries."""
+    monkeypatch.setattr(tc, "API_RETRY_ATTEMPTS", 2)
+    monkeypatch.setattr(tc, "API_RETRY_DELAY", 0)
+    retries = []
+    monkeypatch.setattr(tc.time, "sleep", retries.append)
+    c = _client()
+    lines = iter([b'{"Symbol": "SPY", "Last": ', b'{"Symbol": "SPY", "Last": 1.5}'])
+    c._build_stream_key = lambda endpoint, params: "k"
+    c._get_or_open_stream = lambda key, endpoint, params: {}
+    c._next_stream_json_line = lambda key, state: next(lines)
+    c._close_stream = lambda key: None
+
+    result = c._request_stream_snapshot("marketdata/stream/quotes/SPY")
+
+    assert result == {"Symbol": "SPY", "Last": 1.5}
+    # One backoff sleep: only the RequestException/JSONDecodeError handler
+    # retries with a delay.
+    assert retries == [0]
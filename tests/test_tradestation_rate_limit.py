@@ -188,6 +188,15 @@ def test_strikes_cache_hit_skips_api_call():
     assert calls[0] == 1  # second call served from cache
 
 
+def test_strikes_returned_ascending_from_api_and_cache():
+    c = _bare_client()
+    _stub_request_returning_strikes(c, [110.0, 100.0, 105.0])
+    with patch("src.ingestion.tradestation_client.TS_STRIKES_CACHE_TTL", 3600):
+        first = c.get_option_strikes("SPY", expiration="06-29-2026")
+        second = c.get_option_strikes("SPY", expiration="06-29-2026")
+    assert first == second == [100.0, 105.0, 110.0]
+
+
 def test_strikes_cache_miss_on_different_expiration():
     c = _bare_client()
     calls = _stub_request_returning_strikes(c, [100.0, 105.0])
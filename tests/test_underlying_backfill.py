@@ -9,6 +9,8 @@ from __future__ import annotations
 
 from datetime import date
 
+import pytest
+
 from src.tools.underlying_backfill import (
     _bar_to_row,
     _chunk_ranges,
@@ -114,6 +116,19 @@ class _FakeConn:
         return self._cur
 
 
+@pytest.fixture(autouse=True)
+def _fake_execute_values(monkeypatch):
+    """Route execute_values through the fake cursors' executemany recorders
+    (the real one needs a live connection to mogrify against)."""
+    import psycopg2.extras
+
+    def _execute_values(cur, sql, argslist, page_size=100):
+        assert "VALUES %s" in sql
+        cur.executemany(sql, argslist)
+
+    monkeypatch.setattr(psycopg2.extras, "execute_values", _execute_values)
+
+
 def test_upsert_bars_shapes_rows():
     conn = _FakeConn()
     rows = [r for r in (_bar_to_row(_bar()),) if r]
@@ -165,6 +180,34 @@ def test_fetch_symbol_iterates_chunks_and_dedups():
     assert len(ts) == 3
 
 
+def test_fetch_symbol_prefetch_keeps_chunk_order_and_propagates_errors():
+    class _Client:
+        def __init__(self):
+            self.firsts: list = []
+
+        def get_bars(self, symbol, **kw):
+            self.firsts.append(kw["firstdate"])
+            if len(self.firsts) == 3:
+                raise RuntimeError("upstream down")
+            return {"Bars": []}
+
+    client = _Client()
+    with pytest.raises(RuntimeError, match="upstream down"):
+        fetch_symbol(client, "SPY", date(2022, 1, 1), date(2022, 1, 10), days_per_chunk=2)
+    assert client.firsts == sorted(client.firsts)
+    assert len(client.firsts) == 3
+
+
+def test_fetch_symbol_does_not_pause_by_default(monkeypatch):
+    """Pacing is the client's rate governor's job; no fixed sleep by default."""
+    import src.tools.underlying_backfill as ub
+
+    sleeps: list = []
+    monkeypatch.setattr(ub.time, "sleep", lambda s: sleeps.append(s))
+    fetch_symbol(_FakeClient(), "SPY", date(2022, 1, 1), date(2022, 2, 5), days_per_chunk=25)
+    assert sleeps == []
+
+
 # ----------------------------------------------------------------------
 # Alias resolution: fetch via SYMBOL_ALIASES, write under the canonical symbol
 # ----------------------------------------------------------------------
@@ -182,11 +225,12 @@ def test_backfill_resolves_alias_for_fetch_but_writes_canonical(monkeypatch):
     monkeypatch.setenv("TRADESTATION_CLIENT_ID", "cid")
     monkeypatch.setenv("TRADESTATION_CLIENT_SECRET", "csecret")
     monkeypatch.setenv("TRADESTATION_REFRESH_TOKEN", "crt")
-    # backfill() calls fetch_symbol without sleep_seconds -> default 0.3s pause.
+    # Guard against a pause being configured; the test must never sleep.
     monkeypatch.setattr(ub.time, "sleep", lambda *_a, **_k: None)
 
     fetched: list = []
     written: list = []
+    settings: list = []
 
     class _Client:
         def get_bars(self, symbol, **kw):
@@ -194,6 +238,9 @@ def test_backfill_resolves_alias_for_fetch_but_writes_canonical(monkeypatch):
             return {"Bars": [_bar(TimeStamp="2022-01-03T14:31:00Z")]}
 
     class _Cur:
+        def execute(self, sql, params=None):
+            settings.append(sql)
+
         def executemany(self, sql, seq):
             self.seq = list(seq)
 
@@ -229,6 +276,98 @@ def test_backfill_resolves_alias_for_fetch_but_writes_canonical(monkeypatch):
     # Rows are written under the CANONICAL symbols, not the TS fetch symbols.
     assert sorted(written) == ["NDX", "SPY"]
     assert result == {"NDX": 1, "SPY": 1}
+    # Each chunk transaction relaxes commit durability locally.
+    assert settings == ["SET LOCAL synchronous_commit = off"] * 2
     # Regression guard: the client is built from env credentials, not the
     # invalid no-arg TradeStationClient() the tool used to call.
     assert client_ctor["args"] == ("cid", "csecret", "crt")
+
+
+# ----------------------------------------------------------------------
+# Incremental persistence / resume
+# ----------------------------------------------------------------------
+
+
+class _ResumeConn:
+    def __init__(self, last):
+        self.last = last
+        self.params = None
+
+    def cursor(self):
+        conn = self
+
+        class _C:
+            def execute(self, sql, params):
+                conn.params = params
+
+            def fetchone(self):
+                return (conn.last,)
+
+        return _C()
+
+
+def test_resume_start_defaults_to_window_start_when_nothing_written():
+    from src.tools.underlying_backfill import resume_start
+
+    start = date(2022, 1, 1)
+    assert resume_start(_ResumeConn(None), "SPY", start, date(2022, 3, 1)) == start
+
+
+def test_resume_start_refetches_the_last_written_day():
+    from datetime import datetime, timezone
+
+    from src.tools.underlying_backfill import resume_start
+
+    conn = _ResumeConn(datetime(2022, 2, 10, 20, 59, tzinfo=timezone.utc))
+    assert resume_start(conn, "SPY", date(2022, 1, 1), date(2022, 3, 1)) == date(2022, 2, 10)
+    assert conn.params[0] == "SPY"
+
+
+def test_iter_symbol_chunks_yields_per_chunk_rows():
+    from src.tools.underlying_backfill import iter_symbol_chunks
+
+    client = _FakeClient()
+    chunks = list(
+        iter_symbol_chunks(client, "SPY", date(2022, 1, 1), date(2022, 2, 5), days_per_chunk=25)
+    )
+    # Chunk 2's duplicate of a chunk-1 timestamp is dropped across chunks.
+    assert [len(c) for c in chunks] == [2, 1]
+
+
+def test_iter_symbol_chunks_with_several_in_flight_keeps_range_order():
+    import threading
+    import time as _time
+
+    from src.tools.underlying_backfill import iter_symbol_chunks
+
+    class _Client:
+        """Earlier chunks answer slowest, so completion order is reversed."""
+
+        def __init__(self):
+            self.lock = threading.Lock()
+            self.firsts: list = []
+
+        def get_bars(self, symbol, **kw):
+            with self.lock:
+                self.firsts.append(kw["firstdate"])
+            day = date.fromisoformat(kw["firstdate"][:10])
+            _time.sleep(max(0.0, 0.05 - day.day * 0.005))
+            # Every chunk also repeats the window's first bar.
+            return {
+                "Bars": [
+                    _bar(TimeStamp=f"{kw['firstdate'][:10]}T15:00:00Z"),
+                    _bar(TimeStamp="2022-01-01T15:00:00Z"),
+                ]
+            }
+
+    client = _Client()
+    chunks = list(
+        iter_symbol_chunks(
+            client, "SPY", date(2022, 1, 1), date(2022, 1, 8), days_per_chunk=2, max_in_flight=4
+        )
+    )
+    assert len(client.firsts) == 4
+    firsts = [c[0]["timestamp"].date() for c in chunks]
+    assert firsts == sorted(firsts)
+    # The repeated bar is kept once, in the first chunk only.
+    assert [len(c) for c in chunks] == [1, 1, 1, 1]
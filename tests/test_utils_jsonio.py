@@ -0,0 +1,24 @@
+"""json_loads: optional orjson backend with a stdlib fallback.
+
+The ingestion stream readers catch ``json.JSONDecodeError`` around
+``json_loads``, so whichever backend is active must raise a subclass of it
+and accept both the ``str`` and ``bytes`` lines the readers hand it.
+"""
+
+import json
+
+import pytest
+
+from src.utils import json_loads
+
+_DOC = '{"Symbol": "SPY", "Last": 1.5}'
+
+
+@pytest.mark.parametrize("raw", [_DOC, _DOC.encode()])
+def test_decodes_str_and_bytes(raw):
+    assert json_loads(raw) == {"Symbol": "SPY", "Last": 1.5}
+
+
+def test_bad_input_raises_stdlib_decode_error():
+    with pytest.raises(json.JSONDecodeError):
+        json_loads("{not json")
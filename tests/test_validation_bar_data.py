@@ -0,0 +1,22 @@
+"""validate_bar_data: required-field check and OHLC consistency."""
+
+import logging
+
+from src.validation import validate_bar_data
+
+_BAR = {"TimeStamp": "2026-02-22T14:30:00Z", "Open": "10", "High": "12", "Low": "9", "Close": "11"}
+
+
+def test_complete_consistent_bar_is_valid():
+    assert validate_bar_data(dict(_BAR, TotalVolume="5")) is True
+
+
+def test_missing_field_is_named_in_warning(caplog):
+    bar = {k: v for k, v in _BAR.items() if k not in ("High", "Close")}
+    with caplog.at_level(logging.WARNING):
+        assert validate_bar_data(bar) is False
+    assert "missing required field: High" in caplog.text
+
+
+def test_inconsistent_ohlc_is_invalid():
+    assert validate_bar_data(dict(_BAR, Close="13")) is False
@@ -0,0 +1,27 @@
+"""safe_datetime: the fixed-width 'YYYY-MM-DDTHH:MM:SSZ' fast path must agree
+with the strptime path it short-circuits, and bad input still falls back to
+the default."""
+
+from datetime import datetime
+
+import pytz
+
+from src.validation import ET, safe_datetime
+
+
+def test_fast_path_matches_strptime_parse():
+    raw = "2026-02-22T14:30:05Z"
+    expected = pytz.UTC.localize(datetime.strptime(raw, "%Y-%m-%dT%H:%M:%SZ")).astimezone(ET)
+    got = safe_datetime(raw)
+    assert got == expected
+    assert got.utcoffset() == expected.utcoffset()
+
+
+def test_offset_form_still_parses():
+    assert safe_datetime("2026-02-22T14:30:05+00:00") == safe_datetime("2026-02-22T14:30:05Z")
+
+
+def test_malformed_returns_default():
+    sentinel = datetime(2000, 1, 1)
+    assert safe_datetime("2026-02-22T14:30:6xZ", default=sentinel) is sentinel
+    assert safe_datetime("", default=sentinel) is sentinel